@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+   Created on 18-10-2026
+
+   Compare objectify with the lxml and ElementTree backends on a synthetic project.
+
+   python -m benchmarks.bench_backend --classes 10000
+"""
+__author__ = "Benedict Wilkins"
+__email__ = "benrjw@gmail.com"
+__status__ = "Development"
+
+import time
+import argparse
+import tempfile
+
+import mkdocscs
+from mkdocscs import Log
+from mkdocscs._objectify import SKIP_KINDS
+
+from .synthetic import generate
+
+def summary(result):
+    """ A comparable summary of the rendered model, both backends should produce the same one with or without selective 
+        parsing (file and dir compounds are not rendered, see SKIP_KINDS). """
+    index = result['index']
+    return [(ref.id, ref.obj.name, [(m.id.id, m.definition, str(m.docstring)) for m in getattr(ref.obj, 'members', [])])
+            for kind in sorted(index.__dict__) if kind not in SKIP_KINDS for ref in index.__dict__[kind]]
+
+def measure(path, backend, selective=False, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = mkdocscs.objectify(path, backend=backend, selective=selective)
+        times.append(time.perf_counter() - start)
+    return min(times), summary(result)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="bench_backend")
+    parser.add_argument("--namespaces", type=int, default=100)
+    parser.add_argument("--classes", type=int, default=10000)
+    parser.add_argument("--members", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    Log.get_logger().silent = True
+
+    with tempfile.TemporaryDirectory() as path:
+        generate(path, namespaces=args.namespaces, classes=args.classes, members=args.members)
+        results = {}
+        for backend in ["etree", "lxml"]:
+            for selective in [False, True]:
+                try:
+                    t, model = measure(path, backend, selective=selective, repeat=args.repeat)
+                except ImportError:
+                    print(f"{backend}: not installed")
+                    break
+                results[(backend, selective)] = model
+                print(f"{backend:>6} selective={selective!s:<5}: {t:.2f}s")
+        models = list(results.values())
+        print("models identical:", all(m == models[0] for m in models))
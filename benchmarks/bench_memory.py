@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+   Created on 18-10-2026
+
+   Memory retained by the objectify model of a synthetic project.
+
+   python -m benchmarks.bench_memory --classes 5000 --members 20
+"""
+__author__ = "Benedict Wilkins"
+__email__ = "benrjw@gmail.com"
+__status__ = "Development"
+
+import gc
+import argparse
+import tempfile
+import tracemalloc
+
+import mkdocscs
+from mkdocscs import Log
+
+from .synthetic import generate
+
+def measure(path):
+    gc.collect()
+    tracemalloc.start()
+    with mkdocscs.SymbolTable():
+        result = mkdocscs.objectify(path)
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return retained, peak, result
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="bench_memory")
+    parser.add_argument("--namespaces", type=int, default=50)
+    parser.add_argument("--classes", type=int, default=5000)
+    parser.add_argument("--members", type=int, default=20)
+    args = parser.parse_args()
+    Log.get_logger().silent = True
+
+    with tempfile.TemporaryDirectory() as path:
+        generate(path, namespaces=args.namespaces, classes=args.classes, members=args.members)
+        retained, peak, result = measure(path)
+        members = sum(len(c.obj.members) for c in result['index'].__dict__.get('class', []))
+        print(f"classes: {args.classes}, members: {members}")
+        print(f"retained: {retained / (1 << 20):.1f} MB ({retained / max(members, 1):.0f} B/member), peak: {peak / (1 << 20):.1f} MB")
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+   Created on 18-10-2026
+
+   Cost of building the model from parsed xml elements (compounds and their members), excluding reading the xml files.
+
+   python -m benchmarks.bench_parse --classes 5000 --members 40
+"""
+__author__ = "Benedict Wilkins"
+__email__ = "benrjw@gmail.com"
+__status__ = "Development"
+
+import gc
+import time
+import pathlib
+import argparse
+import tempfile
+
+import mkdocscs
+from mkdocscs import Log
+from mkdocscs import _objectify
+from mkdocscs._backend import set_backend
+
+from .synthetic import generate
+
+def measure(path, repeat=3):
+    """
+        Returns:
+            (float, int): best time to build the model of every compound file in path and the number of members built.
+    """
+    roots = [_objectify.read(file) for file in sorted(pathlib.Path(path).glob("*.xml")) if file.name != "index.xml"]
+    times, members = [], 0
+    for _ in range(repeat):
+        with mkdocscs.SymbolTable():
+            gc.collect()
+            gc.disable() # collections triggered by the model allocations dominate the variance otherwise
+            try:
+                start = time.perf_counter()
+                parsed = [_objectify.parse_compounddef(compounddef) for root in roots for compounddef in root]
+                times.append(time.perf_counter() - start)
+            finally:
+                gc.enable()
+            members = sum(len(getattr(x, 'members', [])) for x in parsed)
+    return min(times), members
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="bench_parse")
+    parser.add_argument("--namespaces", type=int, default=50)
+    parser.add_argument("--classes", type=int, default=5000)
+    parser.add_argument("--members", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    Log.get_logger().silent = True
+
+    with tempfile.TemporaryDirectory() as path:
+        generate(path, namespaces=args.namespaces, classes=args.classes, members=args.members, inheritance=2, references=2)
+        for backend in ["etree", "lxml"]:
+            try:
+                set_backend(backend)
+            except ImportError:
+                print(f"{backend}: not installed")
+                continue
+            t, members = measure(path, repeat=args.repeat)
+            print(f"{backend:>6}: {t:.3f}s, {members} members, {t / max(members, 1) * 1e6:.2f}us per member")
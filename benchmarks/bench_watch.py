@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+   Created on 18-10-2026
+
+   Time to rebuild the documentation of a synthetic project in watch mode after one class is edited. The resolved model is
+   patched (see WatchedModel) rather than loaded from the MemoryCache and resolved again.
+
+   python -m benchmarks.bench_watch --classes 3000 --members 10
+"""
+__author__ = "Benedict Wilkins"
+__email__ = "benrjw@gmail.com"
+__status__ = "Development"
+
+import time
+import pathlib
+import argparse
+import tempfile
+
+import mkdocscs
+from mkdocscs import Log
+from mkdocscs._cache import MemoryCache
+from mkdocscs._watch import WatchedModel, affected
+
+from .synthetic import generate
+
+def edit(file, i):
+    text = file.read_text()
+    file.write_text(text.replace("documentation", f"documentation ({i})", 1) if i == 0 else text.replace(f"({i - 1})", f"({i})", 1))
+
+def rebuild(objects, output, pages, dependencies):
+    start = time.perf_counter()
+    mkdocscs.markdownify(objects, path=output, root_path=output, pages=pages, dependencies=dependencies)
+    return time.perf_counter() - start
+
+def measure_reload(path, output, file, repeat=3):
+    """
+        Each edit loads every file from a MemoryCache and resolves the model again (the previous watch mode).
+
+        Returns:
+            (float, float): best time to update the model and best time to render the affected pages.
+    """
+    cache, dependencies, times = MemoryCache(), {}, []
+    with mkdocscs.SymbolTable() as symbols:
+        rebuild(mkdocscs.objectify(path, cache=cache, symbols=symbols), output, None, dependencies)
+    cache.changed.clear()
+    for i in range(repeat):
+        edit(file, i)
+        with mkdocscs.SymbolTable() as symbols:
+            start = time.perf_counter()
+            objects = mkdocscs.objectify(path, cache=cache, symbols=symbols)
+            changed = set(pathlib.Path(x).stem for x in cache.changed)
+            cache.changed.clear()
+            seconds = time.perf_counter() - start
+            times.append((seconds, rebuild(objects, output, affected(changed, dependencies), dependencies)))
+    return min(t[0] for t in times), min(t[1] for t in times)
+
+def measure_patch(path, output, file, repeat=3):
+    """
+        Each edit parses the edited file again and patches it into the resolved model.
+
+        Returns:
+            (float, float): best time to update the model and best time to render the affected pages.
+    """
+    model, dependencies, times = WatchedModel(path), {}, []
+    try:
+        model.refresh()
+        with model.symbols:
+            rebuild(model.objects, output, None, dependencies)
+        for i in range(repeat):
+            edit(file, i)
+            start = time.perf_counter()
+            changed = model.refresh()
+            seconds = time.perf_counter() - start
+            assert changed == {file.stem}
+            with model.symbols:
+                times.append((seconds, rebuild(model.objects, output, affected(changed, dependencies), dependencies)))
+    finally:
+        model.close()
+    return min(t[0] for t in times), min(t[1] for t in times)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="bench_watch")
+    parser.add_argument("--namespaces", type=int, default=50)
+    parser.add_argument("--classes", type=int, default=3000)
+    parser.add_argument("--members", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    Log.get_logger().silent = True
+
+    with tempfile.TemporaryDirectory() as path:
+        xml = generate(pathlib.Path(path, "xml"), namespaces=args.namespaces, classes=args.classes, members=args.members,
+                       inheritance=2, references=2)
+        file = sorted(xml.glob("class*.xml"))[0]
+        print(f"classes: {args.classes}, members: {args.members}, edited: {file.name}")
+        for name, measure in [("reload", measure_reload), ("patch", measure_patch)]:
+            model, render = measure(str(xml), str(pathlib.Path(path, name)), file, repeat=args.repeat)
+            print(f"{name:>8}: model {model:.3f}s, render {render:.3f}s, total {model + render:.3f}s")
@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+   Created on 18-10-2026
+
+   Timing and peak memory of objectify, namespace filtering and markdownify on synthetic projects of 1k, 10k and 100k compounds.
+   Each benchmark runs in a fresh process so that its peak memory is its own. Results are written as json and can be compared
+   with the results of another version.
+
+   python -m benchmarks.suite --scales 1k 10k --output results.json
+   python -m benchmarks.suite --scales 1k 10k --output new.json --compare results.json
+"""
+__author__ = "Benedict Wilkins"
+__email__ = "benrjw@gmail.com"
+__status__ = "Development"
+
+import os
+import sys
+import json
+import time
+import shutil
+import pathlib
+import platform
+import argparse
+import resource
+import tempfile
+import contextlib
+import subprocess
+import multiprocessing
+
+from mkdocscs._backend import BACKENDS
+
+from .synthetic import generate
+
+RESULTS_VERSION = 1
+SCALES = {"1k" : 1000, "10k" : 10000, "100k" : 100000} # number of compounds
+BENCHMARKS = ["objectify", "objectify_selective", "namespace_filter", "markdownify"]
+
+def project(compounds, members=10, inheritance=3, references=2):
+    """
+        Parameters of a synthetic project with the given number of compounds (see generate).
+    """
+    namespaces = max(1, compounds // 50)
+    return dict(namespaces=namespaces, classes=compounds - namespaces, members=members, depth=3, inheritance=inheritance,
+                references=references)
+
+def _peak_rss():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1 << 20) if sys.platform == "darwin" else rss / (1 << 10) # MB, bytes on macOS otherwise KB
+
+def _run(benchmark, path, repeat, queue, backend):
+    import mkdocscs
+    from mkdocscs import Log
+    from mkdocscs._backend import set_backend
+    Log.get_logger().silent = True
+    set_backend(backend)
+    baseline = _peak_rss()
+    times = []
+    with tempfile.TemporaryDirectory() as output, open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(repeat):
+            with mkdocscs.SymbolTable():
+                if benchmark == "markdownify":
+                    objects = mkdocscs.objectify(path)
+                    start = time.perf_counter()
+                    mkdocscs.markdownify(objects, path=output, root_path=output)
+                else:
+                    start = time.perf_counter()
+                    if benchmark == "objectify":
+                        mkdocscs.objectify(path)
+                    elif benchmark == "objectify_selective":
+                        mkdocscs.objectify(path, selective=True)
+                    elif benchmark == "namespace_filter":
+                        mkdocscs.objectify(path, selective=True, namespaces=["N0", "N1"])
+                    else:
+                        raise ValueError(f"Unknown benchmark {benchmark}, expected one of {BENCHMARKS}")
+                times.append(time.perf_counter() - start)
+            shutil.rmtree(output, ignore_errors=True)
+            pathlib.Path(output).mkdir(exist_ok=True)
+    queue.put(dict(seconds=min(times), runs=times, baseline_rss_mb=baseline, peak_rss_mb=_peak_rss()))
+
+def run(benchmark, path, repeat=3, backend="etree"):
+    """
+        Run a benchmark in a fresh process with the given xml backend.
+
+        Returns:
+            dict: best time (seconds), all times (runs), and resident memory before (baseline_rss_mb) and at the peak
+                (peak_rss_mb) of the run.
+    """
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=_run, args=(benchmark, str(path), repeat, queue, backend))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+def environment(backend):
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=pathlib.Path(__file__).parent).stdout.strip()
+    except OSError:
+        commit = ""
+    return dict(commit=commit, python=platform.python_version(), platform=platform.platform(), backend=backend,
+                date=time.strftime("%Y-%m-%dT%H:%M:%S"))
+
+def compare(results, baseline):
+    """
+        Print the time and peak memory of results relative to baseline (both as written by main).
+    """
+    old = {(r['benchmark'], r['scale']) : r for r in baseline['results']}
+    print(f"{'benchmark':<22}{'scale':>6}{'time':>10}{'old':>10}{'ratio':>8}{'peak MB':>10}{'old':>10}")
+    for r in results['results']:
+        o = old.get((r['benchmark'], r['scale']), None)
+        if o is None:
+            continue
+        print(f"{r['benchmark']:<22}{r['scale']:>6}{r['seconds']:>10.3f}{o['seconds']:>10.3f}{r['seconds'] / o['seconds']:>8.2f}"
+              f"{r['peak_rss_mb']:>10.1f}{o['peak_rss_mb']:>10.1f}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="suite")
+    parser.add_argument("--scales", nargs="+", default=["1k", "10k"], choices=list(SCALES.keys()))
+    parser.add_argument("--benchmarks", nargs="+", default=BENCHMARKS, choices=BENCHMARKS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--backend", type=str, default="etree", choices=list(BACKENDS.keys()), help="XML parser backend of every benchmark.")
+    parser.add_argument("--data", type=str, default=None, help="Directory of the generated projects, reused across runs. Defaults to a temporary directory.")
+    parser.add_argument("--output", type=str, default=None, help="File to write the json results to.")
+    parser.add_argument("--compare", type=str, default=None, help="Results of a previous run to compare with.")
+    args = parser.parse_args(argv)
+
+    results = dict(version=RESULTS_VERSION, environment=environment(args.backend), results=[])
+    with tempfile.TemporaryDirectory() as tmp:
+        data = pathlib.Path(args.data if args.data is not None else tmp)
+        for scale in args.scales:
+            parameters = project(SCALES[scale])
+            path = pathlib.Path(data, scale)
+            if not pathlib.Path(path, "index.xml").exists():
+                print(f"generating {scale} project {parameters}", file=sys.stderr)
+                generate(path, **parameters)
+            for benchmark in args.benchmarks:
+                result = run(benchmark, path, repeat=args.repeat, backend=args.backend)
+                results['results'].append(dict(benchmark=benchmark, scale=scale, compounds=SCALES[scale], **parameters, **result))
+                print(f"{benchmark:<22}{scale:>6}: {result['seconds']:.3f}s, peak {result['peak_rss_mb']:.1f} MB", file=sys.stderr)
+
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=1)
+    else:
+        print(json.dumps(results, indent=1))
+    if args.compare is not None:
+        with open(args.compare, "r") as f:
+            compare(results, json.load(f))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+   Created on 18-10-2026
+
+   Generates a synthetic doxygen xml directory (C#) for benchmarking. The output follows doxygen's compound.xsd and index.xsd,
+   use validate to check it against the schemas written by doxygen (e.g. example/xml). Like doxygen, it writes a file compound
+   with a source listing for each source file (one per namespace) and a dir compound for the source directory, these are never
+   rendered and are skipped by selective parsing.
+
+   python -m benchmarks.synthetic out --classes 10000 --validate example/xml
+"""
+__author__ = "Benedict Wilkins"
+__email__ = "benrjw@gmail.com"
+__status__ = "Development"
+
+import random
+import pathlib
+import argparse
+from xml.sax.saxutils import escape
+
+HEADER = "<?xml version='1.0' encoding='UTF-8' standalone='no'?>\n"
+TYPES = ["int", "float", "string", "bool", "double", "object", "List&lt; int &gt;"]
+MODIFIERS = ["", "", "static ", "readonly ", "virtual ", "abstract ", "override "]
+PROTECTION = ["public", "public", "public", "protected", "private"]
+SECTIONS = {"variable" : "{prot}-attrib", "function" : "{prot}-func", "property" : "property"} # member kind -> sectiondef kind
+
+def _id(kind, name):
+    return kind + name.replace("::", "_1_1")
+
+def _member(compound_id, i, rng):
+    kind = rng.choice(["variable", "function", "property"])
+    prot = rng.choice(PROTECTION)
+    name = f"{kind[0]}{i}"
+    type = rng.choice(MODIFIERS) + rng.choice(TYPES)
+    args = f"({rng.choice(TYPES)} x)" if kind == "function" else ""
+    id = f"{compound_id}_1a{i:032x}"
+    return SECTIONS[kind].format(prot=prot), f"""      <memberdef kind="{kind}" id="{id}" prot="{prot}" static="no">
+        <type>{type}</type>
+        <definition>{type} {name}</definition>
+        <argsstring>{args}</argsstring>
+        <name>{name}</name>
+        <briefdescription>
+<para>Member {name} </para>        </briefdescription>
+        <detaileddescription>
+        </detaileddescription>
+        <inbodydescription>
+        </inbodydescription>
+        <location file="source/{compound_id}.cs" line="{i}" column="1"/>
+      </memberdef>
+""", (kind, name, id)
+
+def _compound(kind, id, name, body, inner=""):
+    attributes = {"dir" : "", "file" : ' language="C#"'}.get(kind, ' language="C#" prot="public"')
+    return f"""{HEADER}<doxygen xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:noNamespaceSchemaLocation="compound.xsd" version="1.8.13">
+  <compounddef id="{id}" kind="{kind}"{attributes}>
+    <compoundname>{escape(name)}</compoundname>
+{inner}{body}  </compounddef>
+</doxygen>
+"""
+
+def _codeline(line, text, refid=None):
+    ref = f' refid="{refid}" refkind="compound"' if refid is not None else ""
+    words = '</highlight><highlight class="normal"><sp/>'.join(escape(word) for word in text.split())
+    return f'<codeline lineno="{line}"{ref}><highlight class="normal">{words}</highlight></codeline>\n'
+
+def _file(name, classes):
+    """ A file compound (see generate) declaring classes, (name, id, member entries) of each class, with its source listing. """
+    inner, code = "", []
+    for class_name, class_id, entries in classes:
+        inner += f'    <innerclass refid="{class_id}" prot="public">{escape(class_name)}</innerclass>\n'
+        code.append((f"public class {class_name.split('::')[-1]} {{", class_id))
+        code.extend((f"public {kind} {member}() {{ return default; }}", None) for kind, member, _ in entries)
+        code.append(("}", None))
+    listing = "".join(_codeline(i + 1, text, refid=refid) for i, (text, refid) in enumerate(code))
+    body = f"""    <briefdescription>
+    </briefdescription>
+    <detaileddescription>
+    </detaileddescription>
+    <programlisting>
+{listing}    </programlisting>
+    <location file="source/{_file_name(name)}"/>
+"""
+    return body, inner
+
+def _file_name(namespace):
+    return f"{namespace.replace('::', '.') or 'global'}.cs"
+
+def _file_id(namespace):
+    return _file_name(namespace).replace(".", "_8")
+
+def _compoundref(tag, id, name):
+    return f'    <{tag} refid="{id}" prot="public" virt="non-virtual">{escape(name.replace("::", "."))}</{tag}>\n'
+
+def generate(path, namespaces=10, classes=100, members=10, depth=2, inheritance=0, references=0, seed=0):
+    """
+        Write a synthetic doxygen xml directory to path.
+
+        Args:
+            path (str): output directory.
+            namespaces (int, optional): number of namespaces. Defaults to 10.
+            classes (int, optional): number of classes (spread over namespaces). Defaults to 100.
+            members (int, optional): members per class. Defaults to 10.
+            depth (int, optional): maximum namespace nesting depth. Defaults to 2.
+            inheritance (int, optional): inheritance fan-out, the number of classes that derive from each class (classes form
+                an inheritance tree). Defaults to 0 (no inheritance).
+            references (int, optional): references to other classes in the documentation of each class. Defaults to 0.
+            seed (int, optional): random seed. Defaults to 0.
+
+        Returns:
+            pathlib.Path: the output directory.
+    """
+    rng = random.Random(seed)
+    path = pathlib.Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    index = []
+
+    names = []
+    for i in range(namespaces):
+        parents = [n for n in names if n.count("::") + 1 < depth]
+        parent = rng.choice(parents) + "::" if len(parents) > 0 and rng.random() < 0.5 else ""
+        names.append(f"{parent}N{i}")
+    inner = {n : [] for n in names}
+    class_names = [f"{names[i % len(names)]}::C{i}" if len(names) > 0 else f"C{i}" for i in range(classes)]
+    class_ids = [_id("class", name) for name in class_names]
+    base = [(i - 1) // inheritance if inheritance > 0 and i > 0 else None for i in range(classes)]
+    derived = {}
+    sources = {} # namespace -> classes declared in its source file
+    for i, b in enumerate(base):
+        if b is not None:
+            derived.setdefault(b, []).append(i)
+
+    for i, (name, id) in enumerate(zip(class_names, class_ids)):
+        refs = _compoundref("basecompoundref", class_ids[base[i]], class_names[base[i]]) if base[i] is not None else ""
+        refs += "".join(_compoundref("derivedcompoundref", class_ids[j], class_names[j]) for j in derived.get(i, []))
+        sections, entries = {}, []
+        for j in range(members):
+            section, member, entry = _member(id, j, rng)
+            sections.setdefault(section, []).append(member)
+            entries.append(entry)
+        body = "".join(f'      <sectiondef kind="{k}">\n{"".join(v)}      </sectiondef>\n' for k, v in sections.items())
+        see = "".join(f'<ref refid="{class_ids[j]}" kindref="compound">{escape(class_names[j].split("::")[-1])}</ref> '
+                      for j in (rng.randrange(classes) for _ in range(references)))
+        detailed = f"\n<para>See {see}</para>" if references > 0 else ""
+        body += f"""    <briefdescription>
+<para>Class <ref refid="{id}" kindref="compound">C{i}</ref> documentation </para>    </briefdescription>
+    <detaileddescription>{detailed}
+    </detaileddescription>
+    <location file="source/{id}.cs" line="1" column="1"/>
+"""
+        pathlib.Path(path, f"{id}.xml").write_text(_compound("class", id, name, body, inner=refs))
+        index.append(("class", id, name, entries))
+        sources.setdefault(names[i % len(names)] if len(names) > 0 else "", []).append((name, id, entries))
+        if len(names) > 0:
+            inner[names[i % len(names)]].append(f'    <innerclass refid="{id}" prot="public">{escape(name)}</innerclass>\n')
+
+    children = {}
+    for name in names:
+        children.setdefault(name.rpartition("::")[0], []).append(name)
+    for name in names:
+        id = _id("namespace", name)
+        namespaces_ = [f'    <innernamespace refid="{_id("namespace", n)}">{n}</innernamespace>\n' for n in children.get(name, [])]
+        body = f"""    <briefdescription>
+<para>Namespace {name} </para>    </briefdescription>
+    <detaileddescription>
+    </detaileddescription>
+    <location file="source/{id}.cs" line="1" column="1"/>
+"""
+        pathlib.Path(path, f"{id}.xml").write_text(_compound("namespace", id, name, body, inner="".join(inner[name] + namespaces_)))
+        index.append(("namespace", id, name, []))
+
+    files = []
+    for name, classes in sources.items():
+        id = _file_id(name)
+        body, inner = _file(name, classes)
+        pathlib.Path(path, f"{id}.xml").write_text(_compound("file", id, _file_name(name), body, inner=inner))
+        index.append(("file", id, _file_name(name), []))
+        files.append(f'    <innerfile refid="{id}">{_file_name(name)}</innerfile>\n')
+    if len(files) > 0:
+        body = """    <briefdescription>
+    </briefdescription>
+    <detaileddescription>
+    </detaileddescription>
+    <location file="source/"/>
+"""
+        pathlib.Path(path, "dir_source.xml").write_text(_compound("dir", "dir_source", "source", body, inner="".join(files)))
+        index.append(("dir", "dir_source", "source", []))
+
+    with pathlib.Path(path, "index.xml").open("w") as f:
+        f.write(HEADER)
+        f.write('<doxygenindex xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:noNamespaceSchemaLocation="index.xsd" version="1.8.13">\n')
+        for kind, id, name, entries in index:
+            f.write(f'  <compound refid="{id}" kind="{kind}"><name>{escape(name)}</name>\n')
+            for mkind, mname, mid in entries:
+                f.write(f'    <member refid="{mid}" kind="{mkind}"><name>{mname}</name></member>\n')
+            f.write('  </compound>\n')
+        f.write('</doxygenindex>\n')
+    return path
+
+def validate(path, schemas, limit=None):
+    """
+        Validate the xml files in path against doxygen's compound.xsd and index.xsd (requires lxml).
+
+        Args:
+            path (str): generated xml directory.
+            schemas (str): directory containing compound.xsd and index.xsd (written by doxygen alongside its xml output).
+            limit (int, optional): maximum number of compound files to validate. Defaults to None (all).
+
+        Returns:
+            list: (file, error) for each invalid file.
+    """
+    from lxml import etree
+    compound = etree.XMLSchema(etree.parse(str(pathlib.Path(schemas, "compound.xsd"))))
+    index = etree.XMLSchema(etree.parse(str(pathlib.Path(schemas, "index.xsd"))))
+    errors = []
+    files = sorted(f for f in pathlib.Path(path).glob("*.xml") if f.name != "index.xml")[:limit]
+    for file, schema in [(pathlib.Path(path, "index.xml"), index), *((f, compound) for f in files)]:
+        if not schema.validate(etree.parse(str(file))):
+            errors.append((file, schema.error_log.last_error))
+    return errors
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="synthetic")
+    parser.add_argument("path", type=str)
+    parser.add_argument("--namespaces", type=int, default=10)
+    parser.add_argument("--classes", type=int, default=100)
+    parser.add_argument("--members", type=int, default=10)
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--inheritance", type=int, default=0)
+    parser.add_argument("--references", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--validate", type=str, default=None, help="Directory containing doxygen's compound.xsd and index.xsd.")
+    args = parser.parse_args()
+    generate(args.path, namespaces=args.namespaces, classes=args.classes, members=args.members, depth=args.depth,
+             inheritance=args.inheritance, references=args.references, seed=args.seed)
+    if args.validate is not None:
+        errors = validate(args.path, args.validate)
+        for file, error in errors:
+            print(f"{file}: {error}")
+        print(f"{len(errors)} invalid files")
@@ -9,6 +9,6 @@ __status__ = "Development"
 
 
 
-from ._objectify import objectify
+from ._objectify import objectify, SymbolTable
 from .markdownify import *
 from .utils import *
\ No newline at end of file
@@ -7,15 +7,17 @@ __author__ = "Benedict Wilkins"
 __email__ = "benrjw@gmail.com"
 __status__ = "Development"
 
+import sys
 import argparse
 import pathlib
-import subprocess
-import re
 
 from pprint import pprint
 
-from . import objectify, markdownify
-from . import Log
+from . import objectify, markdownify, SymbolTable
+from . import Log, Profiler
+from ._watch import watch
+from ._doxygen import run_doxygen
+from ._batch import read_manifest, batch
 
 def clean(path): # TODO implement a better clean... this is not very safe
     import shutil
@@ -23,66 +25,92 @@ def clean(path): # TODO implement a better clean... this is not very safe
         shutil.rmtree(path)
 
 parser = argparse.ArgumentParser(prog="mkdocscs", description="")
-parser.add_argument("--xml", "-x", type=str, default="./xml", help="Directory contain the .xml files generated by doxygen. Defaults to 'xml' in the calling directory.")
+parser.add_argument("--xml", "-x", type=str, default="./xml", help="Directory contain the .xml files generated by doxygen, or a single combined .xml file (see doxygen's combine.xslt). Defaults to 'xml' in the calling directory.")
 parser.add_argument("--output", "-o", type=str, default="./docs", help="Directory to output .md files. Defaults to 'docs' in the calling directory.")
 parser.add_argument("--doxygen", "-d", type=str, default=None, help="Run doxygen using the given config file to generate xml files. The --xml argument will be replaced by doxygen configuration.")
+parser.add_argument("--force-doxygen", default=False, action='store_true', help="Run doxygen (see --doxygen) even if its xml output is up to date with the config and input sources.")
 parser.add_argument("--clean", "-c", default=False, action='store_true', help="Clean output directory of old files.")
+parser.add_argument("--sync", default=False, action='store_true', help="Delete files produced by a previous run that are no longer generated (e.g. pages of deleted classes), other files in the output directory are left alone.")
 parser.add_argument("--silent", default=False, action='store_true', help="Suppress warnings and info.")
 parser.add_argument("--project", "-p", type=str, default="./docs", help="Project root, 'docs' by default. This may differ from --output if working in a subproject, this path is used to compute relative links.")
-parser.add_argument('--namespace', help='Namespaces to include in generated documentation. Defaults to all found.', nargs='+', type=str, default=["Global"])
-
-args = parser.parse_args()
-
-if args.doxygen is not None:
-    Log.log(f"Running doxygen with config {args.doxygen}")
-    doxygen_out = pathlib.Path("./doxygen.log").resolve()
-    with doxygen_out.open('w') as f:
-        result = subprocess.run(["doxygen", args.doxygen], stdout=f, stderr=f)
-        if result.returncode != 0:
-            raise ValueError(f"doxygen ran with errors, please check the log file {doxygen_out}. Consider running 'doxygen' manually to avoid issues.")
-    # find output directory from config
-    with pathlib.Path(args.doxygen).open('r') as f:
-        for line in f.readlines():
-            if re.search("OUTPUT_DIRECTORY[ |\t]+=", line):
-                args.xml = pathlib.Path(line.split("=")[-1].strip(), "xml").resolve()
-                Log.log(f"Using doxygen xml directory {args.output}")
-
-xml_dir = pathlib.Path(args.xml).resolve()
-xml_dir.mkdir(parents=False, exist_ok=True)
-if next(xml_dir.iterdir(), None) is None:
-    raise ValueError(f"Doxygen output directory {xml_dir} cannot be empty, please run 'doxygen' manually or specify the '--doxygen' option.")
-
-out_dir = pathlib.Path(args.output).resolve()
-out_dir.mkdir(parents=False, exist_ok=True)
-if not args.clean and next(out_dir.iterdir(), None) is not None:
-    Log.warn(f"Output directory {out_dir} is not empty and the '--clean' option wasn't specified, old documentation may remain.")
-
-# TODO clean the output dir? maybe do it after generating files?
-if args.clean:
-    Log.log(f"Cleaning directory {out_dir}")
-    clean(out_dir)
-
-objects = objectify(str(xml_dir))
-
-# hacky way to filter namespaces... TODO do this in objectify?
-def filter_namespaces():
-    index = objects['index']
-    include_namespaces = []
-    for n in [n for n in index.namespace if n.obj.name in args.namespace]:
-        include_namespaces.append(n)
-        include_namespaces.extend(n.obj.namespaces)
-    index.namespace = include_namespaces
-
-    Log.log(f"Using namespaces: {[x.obj.name for x in index.namespace]}")
-
-    def _keep(namespace):
-        return namespace in index.namespace
-
-    for k,v in index.__dict__.items():
-        if len(v) == 0 or not hasattr(v[0].obj, 'namespace'):
-            continue
-        index.__dict__[k] = [x for x in v if _keep(x.obj.namespace)]
-
-filter_namespaces()
-
-markdownify(objects, path=args.output, root_path=args.project)
\ No newline at end of file
+parser.add_argument('--namespace', help='Namespaces to include in generated documentation, glob patterns may be used and nested namespaces are included. Defaults to all found.', nargs='+', type=str, default=None)
+parser.add_argument("--selective", "-s", default=False, action='store_true', help="Skip doxygen compounds that are never rendered (dir, file) and drop unused xml subtrees (source listings etc.) while parsing.")
+parser.add_argument("--lazy", default=False, action='store_true', help="Parse only the names, kinds, namespaces and inheritance of compounds up front, their members and documentation are parsed while their page is rendered and dropped afterwards. Reduces peak memory on large projects. --cache-dir is not used.")
+parser.add_argument("--cache-dir", type=str, default=None, help="Directory of a persistent parse cache, xml files that are unchanged since the last run are loaded from it instead of being parsed.")
+parser.add_argument("--cache-size", type=int, default=512, help="Maximum size of the parse cache in MB, least recently used entries are evicted. Defaults to 512.")
+parser.add_argument("--backend", type=str, default="etree", choices=["etree", "lxml"], help="XML parser backend, lxml is optional and reads files faster but builds the model more slowly. Defaults to 'etree'.")
+parser.add_argument("--group-threshold", type=int, default=0, help="Classes and interfaces with fewer members than this are rendered as sections of their namespace page instead of their own page, reduces the page count of large APIs. Defaults to 0 (every class has its own page).")
+parser.add_argument("--split-threshold", type=int, default=0, help="Classes and interfaces with more members than this list their members on a subpage per member kind (functions, variables, ...). Defaults to 0 (members are listed on the class page).")
+parser.add_argument("--index-limit", type=int, default=0, help="Index pages (Namespace, Class, Interface) with more entries than this are split into alphabetical pages of at most this many entries. Defaults to 0 (a single index page).")
+parser.add_argument("--inheritance", default=False, action='store_true', help="List all bases of each class and interface, not only the direct bases, and the members it inherits from them.")
+parser.add_argument("--watch", "-w", default=False, action='store_true', help="Keep running and rebuild when the doxygen xml files change, only changed files are parsed again and only the pages that depend on them are rendered. --cache-dir is not used.")
+parser.add_argument("--watch-interval", type=float, default=0.25, help="Polling interval of --watch in seconds. Defaults to 0.25.")
+parser.add_argument("--profile", type=str, nargs='?', const="mkdocscs-profile", default=None, help="Record the time, cpu time, files and bytes read and written of each phase and the slowest files and pages. Writes PROFILE.json and a Chrome trace PROFILE.trace.json, PROFILE defaults to 'mkdocscs-profile'.")
+parser.add_argument("--profile-memory", default=False, action='store_true', help="Also record the tracemalloc peak of each phase with --profile (slower).")
+parser.add_argument("--batch", type=str, default=None, help="Build every project of a json manifest (see mkdocscs/_batch.py) in one invocation, --jobs projects are built concurrently. Options given here are the defaults of each project, --xml, --output, --project and --namespace are ignored.")
+parser.add_argument("--jobs", "-j", type=int, default=1, help="Number of worker processes used to parse the doxygen xml files and render pages. Defaults to 1 (no worker processes).")
+
+def main(argv=None):
+    args = parser.parse_args(argv)
+    Log(silent=args.silent)
+    if args.batch is not None:
+        return run_batch(args)
+    profiler = Profiler.start(memory=args.profile_memory) if args.profile is not None else None
+    build(args)
+    if profiler is not None:
+        Profiler.stop()
+        profiler.summary()
+        profiler.write(f"{args.profile}.json")
+        profiler.write_trace(f"{args.profile}.trace.json")
+        Log.log(f"Profile written to {args.profile}.json and {args.profile}.trace.json")
+    return 0
+
+def run_batch(args):
+    defaults = dict(selective=args.selective, lazy=args.lazy, backend=args.backend, cache_size=args.cache_size * (1 << 20), 
+                    group_threshold=args.group_threshold, split_threshold=args.split_threshold, index_limit=args.index_limit, 
+                    inheritance=args.inheritance, sync=args.sync)
+    projects = read_manifest(args.batch, defaults=defaults)
+    if args.cache_dir is not None:
+        for project in projects: # projects may be built concurrently, each has its own cache
+            project.setdefault('cache_dir', str(pathlib.Path(args.cache_dir, project['name']).resolve()))
+    results = batch(projects, workers=args.jobs)
+    for result in results:
+        Log.log(f"{result.name}: {'failed' if result.error is not None else 'built'} in {result.seconds:.2f}s")
+    return 1 if any(result.error is not None for result in results) else 0
+
+def build(args):
+    if args.doxygen is not None:
+        args.xml = run_doxygen(args.doxygen, force=args.force_doxygen)
+
+    xml_dir = pathlib.Path(args.xml).resolve()
+    if not xml_dir.is_file(): # otherwise a combined xml file
+        xml_dir.mkdir(parents=False, exist_ok=True)
+        if next(xml_dir.iterdir(), None) is None:
+            raise ValueError(f"Doxygen output directory {xml_dir} cannot be empty, please run 'doxygen' manually or specify the '--doxygen' option.")
+
+    out_dir = pathlib.Path(args.output).resolve()
+    out_dir.mkdir(parents=False, exist_ok=True)
+    if not args.clean and not args.sync and next(out_dir.iterdir(), None) is not None:
+        Log.warn(f"Output directory {out_dir} is not empty and neither the '--sync' nor '--clean' option was specified, old documentation may remain.")
+
+    # TODO clean the output dir? maybe do it after generating files?
+    if args.clean:
+        Log.log(f"Cleaning directory {out_dir}")
+        clean(out_dir)
+
+    if args.watch:
+        watch(str(xml_dir), output=args.output, root_path=args.project, interval=args.watch_interval,
+              objectify_kwargs=dict(workers=args.jobs, backend=args.backend, selective=args.selective, namespaces=args.namespace),
+              markdownify_kwargs=dict(workers=args.jobs, group_threshold=args.group_threshold, split_threshold=args.split_threshold,
+                                      index_limit=args.index_limit, inheritance=args.inheritance, sync=args.sync))
+    else:
+        with SymbolTable(): # lazily parsed objects are loaded from the table while rendering
+            objects = objectify(str(xml_dir), workers=args.jobs, backend=args.backend, selective=args.selective, namespaces=args.namespace,
+                                cache_dir=args.cache_dir, cache_size=args.cache_size * (1 << 20), lazy=args.lazy)
+            Log.log(f"Using namespaces: {[x.obj.name for x in objects['index'].namespace]}")
+
+            markdownify(objects, path=args.output, root_path=args.project, workers=args.jobs, group_threshold=args.group_threshold,
+                        split_threshold=args.split_threshold, index_limit=args.index_limit, inheritance=args.inheritance, sync=args.sync)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+   Created on 18-10-2026
+
+   XML parser backends, xml.etree.ElementTree by default or lxml (optional). Both produce elements with the ElementTree API.
+   lxml reads files faster, but each python level access to its elements is slower, which outweighs the faster reads when the
+   model is built (see benchmarks/bench_backend.py), so it is only used if requested.
+"""
+__author__ = "Benedict Wilkins"
+__email__ = "benrjw@gmail.com"
+__status__ = "Development"
+
+import contextvars
+import xml.etree.ElementTree as ET
+
+class ElementTreeBackend:
+
+    name = "etree"
+
+    def parse(self, file, skip=None):
+        root = ET.parse(file).getroot()
+        if skip:
+            for x in root:
+                self.strip(x, skip)
+        return root
+
+    def strip(self, x, skip):
+        # only the children of x, visiting every element in python costs more than the subtrees it would drop, deeper 
+        # subtrees are ignored when the model is built
+        for child in [child for child in x if child.tag in skip]:
+            x.remove(child)
+
+    def iterparse(self, file, tags):
+        for _, x in ET.iterparse(file, events=("end",)):
+            if x.tag in tags:
+                yield x
+
+    def stream(self, file, tag):
+        root = None
+        for event, x in ET.iterparse(file, events=("start", "end")):
+            if root is None:
+                root = x
+            elif event == "end" and x.tag == tag:
+                yield x
+                root.remove(x)
+
+    def findall(self, x, path):
+        return x.findall(path)
+
+class LxmlBackend:
+
+    name = "lxml"
+
+    def __init__(self):
+        from lxml import etree
+        self.etree = etree
+        self._parser = etree.XMLParser(remove_comments=True, remove_pis=True, huge_tree=True)
+        self._xpath = {}
+
+    def parse(self, file, skip=None):
+        root = self.etree.parse(str(file), parser=self._parser).getroot()
+        if skip:
+            self.strip(root, skip)
+        return root
+
+    def strip(self, x, skip):
+        self.etree.strip_elements(x, *skip, with_tail=False)
+
+    def iterparse(self, file, tags):
+        for _, x in self.etree.iterparse(str(file), events=("end",), tag=tags, huge_tree=True):
+            yield x
+
+    def stream(self, file, tag):
+        for _, x in self.etree.iterparse(str(file), events=("end",), tag=tag, huge_tree=True, remove_comments=True, remove_pis=True):
+            yield x
+            x.clear()
+            while x.getprevious() is not None: # cleared siblings are still held by the parent
+                del x.getparent()[0]
+
+    def findall(self, x, path):
+        xpath = self._xpath.get(path, None)
+        if xpath is None:
+            xpath = self._xpath[path] = self.etree.XPath(path)
+        return xpath(x)
+
+BACKENDS = {"etree" : ElementTreeBackend, "lxml" : LxmlBackend}
+_BACKEND = contextvars.ContextVar("xml_backend", default=None) # per thread, like the symbol table of a build
+
+def set_backend(name="etree"):
+    """
+        Set the xml parser backend of the current thread.
+
+        Args:
+            name (str, optional): "etree" or "lxml". Defaults to "etree".
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown xml backend {name}, expected one of {list(BACKENDS.keys())}.")
+    backend = BACKENDS[name]()
+    _BACKEND.set(backend)
+    return backend
+
+def get_backend():
+    backend = _BACKEND.get()
+    if backend is None:
+        backend = set_backend()
+    return backend
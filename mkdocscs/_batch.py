@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+   Created on 18-10-2026
+
+   Building several projects in one invocation. A manifest (json) lists the projects, paths are relative to the manifest:
+
+   {
+     "defaults": {"selective": true, "group_threshold": 5},
+     "projects": [
+       {"name": "core", "xml": "core/xml", "output": "docs/core", "project": "docs", "namespaces": ["Core*"]},
+       {"name": "tools", "doxygen": "tools/Doxyfile", "output": "docs/tools", "project": "docs"}
+     ]
+   }
+"""
+__author__ = "Benedict Wilkins"
+__email__ = "benrjw@gmail.com"
+__status__ = "Development"
+
+import json
+import time
+import pathlib
+import traceback
+import concurrent.futures
+from collections import namedtuple
+
+from .utils import Log
+from ._objectify import objectify, SymbolTable
+from ._doxygen import run_doxygen
+from .markdownify import markdownify
+
+OBJECTIFY_OPTIONS = frozenset(["selective", "lazy", "backend", "cache_dir", "cache_size"])
+MARKDOWNIFY_OPTIONS = frozenset(["group_threshold", "split_threshold", "index_limit", "inheritance", "sync", "symbol_index"])
+PATH_OPTIONS = frozenset(["xml", "doxygen", "output", "project", "cache_dir"])
+OPTIONS = OBJECTIFY_OPTIONS | MARKDOWNIFY_OPTIONS | PATH_OPTIONS | frozenset(["name", "namespaces"])
+
+BuildResult = namedtuple("BuildResult", ["name", "seconds", "error"])
+
+def read_manifest(path, defaults=None):
+    """
+        Read a batch manifest (see module documentation). Each project has an output directory and either an xml directory
+        (or combined xml file) or a doxygen configuration, the other options of build may be given per project or in defaults.
+        Project names must be unique, a project is named after its output directory unless it is given a name.
+
+        Args:
+            path (str): manifest file.
+            defaults (dict, optional): options of every project, overridden by the defaults of the manifest. Defaults to None.
+
+        Returns:
+            list: options of each project (see build), paths are absolute.
+    """
+    path = pathlib.Path(path).resolve()
+    with path.open('r') as f:
+        manifest = json.load(f)
+    projects = []
+    for i, entry in enumerate(manifest.get('projects', [])):
+        options = {**(defaults or {}), **manifest.get('defaults', {}), **entry}
+        unknown = set(options) - OPTIONS
+        if len(unknown) > 0:
+            raise ValueError(f"Unknown options {sorted(unknown)} of project {i} in {path}, expected some of {sorted(OPTIONS)}.")
+        if 'output' not in options or ('xml' not in options and 'doxygen' not in options):
+            raise ValueError(f"Project {i} in {path} must give 'output' and one of 'xml' or 'doxygen'.")
+        for key in PATH_OPTIONS & set(options):
+            if options[key] is not None:
+                options[key] = str(pathlib.Path(path.parent, options[key]).resolve())
+        options.setdefault('name', pathlib.Path(options['output']).name)
+        projects.append(options)
+    names = {}
+    for i, options in enumerate(projects): # names key the cache directory and doxygen log of each project
+        if options['name'] in names:
+            raise ValueError(f"Projects {names[options['name']]} and {i} in {path} are both named '{options['name']}' (by default the "
+                             "name of the output directory), give them distinct names.")
+        names[options['name']] = i
+    return projects
+
+def build(xml=None, output="./docs", project=None, namespaces=None, doxygen=None, workers=None, name=None, **options):
+    """
+        Build the documentation of a single project in its own symbol table (see objectify and markdownify).
+
+        Args:
+            xml (str, optional): doxygen xml directory or combined xml file. Defaults to None (the output of doxygen).
+            output (str, optional): output directory. Defaults to "./docs".
+            project (str, optional): project root used to compute relative links. Defaults to None (output).
+            namespaces (list, optional): namespaces to include. Defaults to None (all).
+            doxygen (str, optional): doxygen configuration, doxygen is run if its xml output is not current. Its output is 
+                written to doxygen-NAME.log (doxygen.log if there is no name). Defaults to None.
+            workers (int, optional): number of worker processes of objectify and markdownify. Defaults to None.
+            name (str, optional): name of the project. Defaults to None.
+            options: other options of objectify (see OBJECTIFY_OPTIONS) and markdownify (see MARKDOWNIFY_OPTIONS).
+    """
+    if doxygen is not None:
+        xml = run_doxygen(doxygen, log=f"doxygen-{name}.log" if name is not None else "doxygen.log")
+    objectify_kwargs = {k : v for k, v in options.items() if k in OBJECTIFY_OPTIONS}
+    markdownify_kwargs = {k : v for k, v in options.items() if k in MARKDOWNIFY_OPTIONS}
+    with SymbolTable():
+        objects = objectify(str(xml), workers=workers, namespaces=namespaces, **objectify_kwargs)
+        markdownify(objects, path=str(output), root_path=str(project if project is not None else output), workers=workers,
+                    **markdownify_kwargs)
+
+def _build(options):
+    start = time.perf_counter()
+    try:
+        build(**options)
+        error = None
+    except Exception:
+        error = traceback.format_exc()
+        Log.warn(f"Failed to build {options['name']}:\n{error}")
+    return BuildResult(options['name'], time.perf_counter() - start, error)
+
+def _initialize(silent):
+    Log(silent=silent) # workers that are spawned rather than forked do not inherit the logger
+
+def batch(projects, workers=1):
+    """
+        Build each project (see read_manifest and build). If workers > 1 the projects are built concurrently in a shared pool of
+        worker processes, each project is built by a single worker. A project that fails does not stop the others.
+
+        Returns:
+            list: BuildResult (name, seconds, error) of each project, error is None if the project was built.
+    """
+    if workers is None or workers <= 1 or len(projects) <= 1:
+        return [_build(options) for options in projects]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=min(workers, len(projects)), initializer=_initialize,
+                                                initargs=(Log.get_logger().silent,)) as pool:
+        return list(pool.map(_build, projects))
@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+   Created on 18-10-2026
+"""
+__author__ = "Benedict Wilkins"
+__email__ = "benrjw@gmail.com"
+__status__ = "Development"
+
+import os
+import json
+import time
+import pickle
+import hashlib
+import pathlib
+
+from .utils import Log
+
+CACHE_VERSION = 4 # increment when the parsed objects change, old cache entries will be discarded
+DEFAULT_CACHE_SIZE = 512 * (1 << 20) # bytes
+MANIFEST = "manifest.json"
+
+def file_hash(file):
+    h = hashlib.sha256()
+    with open(file, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+class ParseCache:
+    """
+        On-disk cache of parsed xml files. Entries are keyed by file path and validated by size and mtime, falling back to a
+        content hash if the stat has changed. Parsed objects are pickled with their references by id, they are resolved against
+        the reference registry when loaded. Least recently used entries are evicted when the cache exceeds max_size bytes.
+    """
+
+    def __init__(self, path, max_size=DEFAULT_CACHE_SIZE):
+        self.path = pathlib.Path(path).resolve()
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self.entries = self._load_manifest()
+        self.hits, self.misses = 0, 0
+
+    def _load_manifest(self):
+        manifest = pathlib.Path(self.path, MANIFEST)
+        try:
+            with manifest.open('r') as f:
+                data = json.load(f)
+            if data.get('version', None) == CACHE_VERSION:
+                return data['entries']
+            Log.log(f"Discarding parse cache {self.path}, version has changed.")
+        except FileNotFoundError:
+            return {}
+        except (ValueError, KeyError):
+            Log.warn(f"Discarding invalid parse cache {self.path}.")
+        for blob in self.path.glob("*.pickle"):
+            blob.unlink()
+        return {}
+
+    def _blob(self, file):
+        return pathlib.Path(self.path, hashlib.sha1(str(file).encode()).hexdigest() + ".pickle")
+
+    def get(self, file):
+        """
+            Returns:
+                (bool, object): whether the file was found in the cache and the parsed object.
+        """
+        file = str(file)
+        entry = self.entries.get(file, None)
+        if entry is not None:
+            stat = os.stat(file)
+            valid = entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime_ns
+            if not valid and entry['size'] == stat.st_size and entry['hash'] == file_hash(file):
+                entry['mtime'], valid = stat.st_mtime_ns, True # touched but unchanged
+            if valid:
+                try:
+                    with self._blob(file).open('rb') as f:
+                        obj = pickle.load(f)
+                    entry['used'] = time.time()
+                    self.hits += 1
+                    return True, obj
+                except (OSError, pickle.UnpicklingError, EOFError):
+                    pass
+            del self.entries[file]
+        self.misses += 1
+        return False, None
+
+    def put(self, file, obj):
+        file = str(file)
+        stat = os.stat(file)
+        blob = self._blob(file)
+        tmp = blob.with_suffix(".tmp")
+        with tmp.open('wb') as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, blob)
+        self.entries[file] = dict(size=stat.st_size, mtime=stat.st_mtime_ns, hash=file_hash(file),
+                                  bytes=blob.stat().st_size, used=time.time())
+
+    def evict(self):
+        """
+            Remove least recently used entries until the cache is no larger than max_size.
+        """
+        total = sum(e['bytes'] for e in self.entries.values())
+        for file, entry in sorted(self.entries.items(), key=lambda x: x[1]['used']):
+            if total <= self.max_size:
+                break
+            total -= entry['bytes']
+            del self.entries[file]
+            self._blob(file).unlink(missing_ok=True)
+
+    def save(self):
+        self.evict()
+        manifest = pathlib.Path(self.path, MANIFEST)
+        tmp = manifest.with_suffix(".tmp")
+        with tmp.open('w') as f:
+            json.dump(dict(version=CACHE_VERSION, entries=self.entries), f)
+        os.replace(tmp, manifest)
+        Log.log(f"Parse cache: {self.hits} hits, {self.misses} misses.")
+
+class MemoryCache:
+    """
+        In-memory parse cache with the interface of ParseCache, used by watch mode. Parsed objects are kept pickled so that each
+        load produces fresh objects bound to the current symbol table. Files whose content changed since they were last cached 
+        are collected in changed.
+    """
+
+    def __init__(self):
+        self.entries = {}
+        self.changed = set()
+        self.hits, self.misses = 0, 0
+
+    def get(self, file):
+        file = str(file)
+        entry = self.entries.get(file, None)
+        if entry is not None:
+            stat = os.stat(file)
+            valid = entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime_ns
+            if not valid and entry['size'] == stat.st_size and entry['hash'] == file_hash(file):
+                entry['mtime'], valid = stat.st_mtime_ns, True # rewritten but unchanged (doxygen rewrites every file)
+            if valid:
+                self.hits += 1
+                return True, pickle.loads(entry['blob'])
+        self.misses += 1
+        return False, None
+
+    def put(self, file, obj):
+        file = str(file)
+        stat, digest = os.stat(file), file_hash(file)
+        entry = self.entries.get(file, None)
+        if entry is None or entry['hash'] != digest:
+            self.changed.add(file)
+        self.entries[file] = dict(size=stat.st_size, mtime=stat.st_mtime_ns, hash=digest, 
+                                  blob=pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def remove(self, file):
+        if self.entries.pop(str(file), None) is not None:
+            self.changed.add(str(file))
+
+    def save(self):
+        pass
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+   Created on 18-10-2026
+
+   Running doxygen. A run is skipped if the xml output is current, i.e. it was generated from the same configuration and the
+   same input sources.
+"""
+__author__ = "Benedict Wilkins"
+__email__ = "benrjw@gmail.com"
+__status__ = "Development"
+
+import os
+import re
+import json
+import shlex
+import fnmatch
+import hashlib
+import pathlib
+import subprocess
+
+from .utils import Log
+from .utils import _profile as profile
+from ._cache import file_hash
+
+FINGERPRINT_VERSION = 1
+STAMP = ".mkdocscs-doxygen.json" # written to the xml output directory after a successful run
+
+DEFAULT_FILE_PATTERNS = ["*.c", "*.cc", "*.cxx", "*.cpp", "*.c++", "*.java", "*.ii", "*.ixx", "*.ipp", "*.i++", "*.inl", "*.idl",
+                         "*.ddl", "*.odl", "*.h", "*.hh", "*.hxx", "*.hpp", "*.h++", "*.l", "*.cs", "*.d", "*.php", "*.php4",
+                         "*.php5", "*.phtml", "*.inc", "*.m", "*.markdown", "*.md", "*.mm", "*.dox", "*.py", "*.pyw", "*.f90",
+                         "*.f95", "*.f03", "*.f08", "*.f18", "*.f", "*.for", "*.vhd", "*.vhdl", "*.ucf", "*.qsf", "*.ice"]
+
+def _split(value):
+    """
+        Split a doxygen value into its items, items are separated by whitespace (or commas) and may be double quoted.
+    """
+    lexer = shlex.shlex(value, posix=True)
+    lexer.quotes = '"' # doxygen only quotes with ", apostrophes are literal (e.g. PROJECT_BRIEF = Bob's docs)
+    lexer.whitespace += ","
+    lexer.whitespace_split = True
+    lexer.commenters = ""
+    lexer.escape = "" # backslashes are path separators on windows
+    return list(lexer)
+
+def _expand(value):
+    return re.sub(r"\$\((\w+)\)", lambda m: os.environ.get(m.group(1), ""), value)
+
+def parse_config(path, config=None):
+    """
+        Parse a doxygen configuration file. Handles comments, line continuations (\\), quoted values, += and @INCLUDE (relative to
+        @INCLUDE_PATH or the working directory), and $(VAR) environment variables.
+
+        Args:
+            path (str): configuration file.
+            config (dict, optional): configuration to update (used for @INCLUDE). Defaults to None.
+
+        Returns:
+            dict: tag -> list of values.
+    """
+    config = {} if config is None else config
+    with pathlib.Path(path).open('r', errors='replace') as f:
+        text = re.sub(r"\\\r?\n", " ", f.read()) # join continued lines
+    for line in text.splitlines():
+        line = line.strip()
+        if len(line) == 0 or line.startswith("#"):
+            continue
+        match = re.match(r"^(@?[A-Za-z_][A-Za-z0-9_]*)\s*(\+?=)(.*)$", line)
+        if match is None:
+            Log.warn(f"Ignoring invalid line in doxygen config {path}: {line}")
+            continue
+        tag, op, value = match.group(1), match.group(2), _split(_expand(match.group(3)))
+        if tag == "@INCLUDE":
+            for include in value:
+                include_path = [pathlib.Path(p, include) for p in config.get("@INCLUDE_PATH", [])]
+                include_path = next((p for p in include_path if p.exists()), pathlib.Path(include))
+                parse_config(include_path, config=config)
+        elif op == "+=":
+            config.setdefault(tag, []).extend(value)
+        else:
+            config[tag] = value
+    return config
+
+def _get(config, tag, default=""):
+    value = config.get(tag, [])
+    return " ".join(value) if len(value) > 0 else default
+
+def xml_directory(config):
+    """
+        The xml output directory of a doxygen configuration, relative paths are relative to the working directory.
+    """
+    return pathlib.Path(_get(config, "OUTPUT_DIRECTORY", "."), _get(config, "XML_OUTPUT", "xml")).resolve()
+
+def input_files(config):
+    """
+        The input source files of a doxygen configuration (INPUT, FILE_PATTERNS, RECURSIVE, EXCLUDE, EXCLUDE_PATTERNS), sorted.
+    """
+    patterns = config.get("FILE_PATTERNS", None) or DEFAULT_FILE_PATTERNS
+    recursive = _get(config, "RECURSIVE", "NO").upper() == "YES"
+    exclude = [pathlib.Path(x).resolve() for x in config.get("EXCLUDE", [])]
+    exclude_patterns = config.get("EXCLUDE_PATTERNS", [])
+
+    def _excluded(path):
+        if any(path == x or x in path.parents for x in exclude):
+            return True
+        return any(fnmatch.fnmatch(str(path), p) for p in exclude_patterns)
+
+    result = set()
+    for source in (config.get("INPUT", None) or ["."]):
+        source = pathlib.Path(source).resolve()
+        if source.is_file():
+            if not _excluded(source):
+                result.add(source)
+            continue
+        for root, dirs, names in os.walk(source):
+            root = pathlib.Path(root)
+            dirs[:] = sorted(d for d in dirs if not _excluded(pathlib.Path(root, d))) if recursive else []
+            for name in names:
+                path = pathlib.Path(root, name)
+                if any(fnmatch.fnmatch(name, p) for p in patterns) and not _excluded(path):
+                    result.add(path)
+    return sorted(result)
+
+def fingerprint(config):
+    """
+        Fingerprint of a doxygen run: the parsed configuration and the path and content of each input file.
+    """
+    h = hashlib.sha256()
+    h.update(json.dumps(dict(version=FINGERPRINT_VERSION, config=config), sort_keys=True).encode())
+    for file in input_files(config):
+        h.update(f"\n{file}\n{file_hash(file)}".encode())
+    return h.hexdigest()
+
+@profile.profiled("doxygen")
+def run_doxygen(config_file, log="doxygen.log", executable="doxygen", force=False):
+    """
+        Run doxygen with a configuration file unless its xml output is already current.
+
+        Args:
+            config_file (str): doxygen configuration file.
+            log (str, optional): file that doxygen output is written to. Defaults to "doxygen.log".
+            executable (str, optional): doxygen executable. Defaults to "doxygen".
+            force (bool, optional): run doxygen even if the xml output is current. Defaults to False.
+
+        Returns:
+            pathlib.Path: the xml output directory.
+    """
+    config = parse_config(config_file)
+    xml_dir = xml_directory(config)
+    stamp = pathlib.Path(xml_dir, STAMP)
+    current = fingerprint(config)
+    if not force and pathlib.Path(xml_dir, "index.xml").exists():
+        try:
+            with stamp.open('r') as f:
+                if json.load(f).get('fingerprint', None) == current:
+                    Log.log(f"Doxygen output {xml_dir} is up to date, skipping doxygen.")
+                    return xml_dir
+        except (OSError, ValueError):
+            pass
+
+    Log.log(f"Running doxygen with config {config_file}")
+    doxygen_out = pathlib.Path(log).resolve()
+    with doxygen_out.open('w') as f:
+        result = subprocess.run([executable, str(config_file)], stdout=f, stderr=f)
+    if result.returncode != 0:
+        stamp.unlink(missing_ok=True)
+        raise ValueError(f"doxygen ran with errors, please check the log file {doxygen_out}. Consider running 'doxygen' manually to avoid issues.")
+    if xml_dir.exists():
+        with stamp.open('w') as f:
+            json.dump(dict(fingerprint=current), f)
+    Log.log(f"Using doxygen xml directory {xml_dir}")
+    return xml_dir
@@ -7,17 +7,29 @@ __author__ = "Benedict Wilkins"
 __email__ = "benrjw@gmail.com"
 __status__ = "Development"
 
+import os
+import sys
+import time
 import glob
 import itertools
 import pathlib
+import contextvars
+import concurrent.futures
+import functools
+import pickle
+import fnmatch
+import contextlib
 from pprint import pprint
 
 from types import SimpleNamespace
-import xml.etree.ElementTree as ET
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
+from collections import namedtuple
 from typing import List, Dict, Tuple, Union
 
 from .utils import Log
+from .utils import _profile as profile
+from ._cache import ParseCache, DEFAULT_CACHE_SIZE
+from ._backend import get_backend, set_backend
 
 ID = "id"
 NAME = "compoundname"
@@ -35,63 +47,36 @@ DIRECTORY = "dir"
 FILE = "file"
 DEFINITION = "definition"
 
+SKIP_KINDS = frozenset(["dir", "file"]) # compound kinds that are never rendered, skipped by selective parsing
+SKIP_TAGS = frozenset(["programlisting", "inbodydescription", "listofallmembers"]) # unused subtrees, dropped by selective parsing
+# subtrees dropped by the first pass of lazy parsing, members and documentation are parsed when a page is rendered (see load)
+LAZY_SKIP_TAGS = SKIP_TAGS | frozenset(["sectiondef", "briefdescription", "detaileddescription", "inheritancegraph", "collaborationgraph"])
+GLOBAL_ID = "namespace__Global"
+GLOBAL_NAME = "Global"
+COMPOUND_KINDS = frozenset(["class", "struct", "union", "interface", "protocol", "category", "exception"])
+
 
 def get_id(x):
     return Reference(x.attrib[ID], None)
 
-def get_name(x):
-    name = x.find(NAME)
-    name = name if name is not None else x.find(NAME2)
-    return name.text
+def intern(x):
+    # names, kinds, protections and types repeat across many members, share a single string for each
+    return sys.intern(x) if x is not None else None
 
 def get_kind(x):
-    return x.attrib[KIND]
+    return intern(x.attrib[KIND])
 
 def get_protection(x):
-    return x.attrib[PROTECTION]
+    return intern(x.attrib[PROTECTION])
 
-def get_documentation(x):
-    return Documentation(parse_documentation(x.find(DOC_SHORT)), parse_documentation(x.find(DOC_LONG)))
+def get_documentation(fields):
+    brief, detailed = fields.get('brief', None), fields.get('detailed', None)
+    if brief is None and detailed is None:
+        return None # not read, see LAZY_SKIP_TAGS
+    return Documentation(brief if brief is not None else DocumentationList(), detailed if detailed is not None else DocumentationList())
 
 def get_path(x):
-    return x.find('location').attrib[FILE]
-
-def get_inherit_from(x):
-    def _get_reference(y):
-        if 'refid' in y.keys():
-            return Reference(y.attrib['refid'], None)
-        else:
-            return Reference("__External", None) # The reference is external, there is not link to it...
-    return [_get_reference(y) for y in x.findall('basecompoundref')]
-
-def get_inherit_by(x):
-    return [Reference(y.attrib['refid'], None) for y in x.findall('derivedcompoundref')]
-
-def get_template(x):
-    ts = x.find('templateparamlist')
-    ts = ts if ts is not None else []
-    # TODO more complex template doc requires inspecting source xml file...
-    ts = [t.find('type').text for t in ts]
-    return ts
-
-def get_type(x):
-    text = x.find('type').text
-    text = text if text is not None else "" # if theres not text, probably a constructor or something...
-    return text
-
-def get_arguments(x):
-    return x.find('argsstring').text # TODO lazy...
-
-def get_members(x):
-    def _members():
-        for section in x.findall(SECTION):
-            for m in section.findall(MEMEBER):
-                if get_protection(m) != 'private':
-                    yield m
-    return [m for m in _members()]
-
-def get_definition(x):
-    return x.find(DEFINITION).text
+    return intern(x.find('location').attrib[FILE])
 
 class ParseError(Exception):
     pass 
@@ -109,6 +94,8 @@ def _parse_decorate(fun):
 
 class DocumentationList:
 
+    __slots__ = ("doc",)
+
     def __init__(self):
         self.doc = []
 
@@ -131,42 +118,32 @@ class DocumentationList:
 class Reference:
 
     EXTERNAL_ID = "__External"
-    __reference__ = {}
+    __slots__ = ("id", "obj")
 
     def __new__(cls, *args, **kwargs):
+        # references are unique by id within the current symbol table
         id, obj = args
-        id = id.strip()
-        if len(id) == 0: # an empty id means the ref could not be found, use EXTERNAL
-            id = Reference.EXTERNAL_ID 
-        #print("REF", id)
-            
-        if id not in Reference.__reference__:
-            instance = super().__new__(cls)
-            instance.id, instance.obj = id, obj
-            Reference.__reference__[id] = instance
-            #print("NEW REF", id, instance.id, instance.obj)
-        else:
-            instance = Reference.__reference__[id]
-            #print("OLD REF", id, instance.id, instance.obj)
-        return instance
+        return SymbolTable.current().reference(id, obj)
 
     ## IMPORTANT that there is no __init__... otherwise things can break!
 
+    def __reduce__(self):
+        # references are pickled by id only, unpickling resolves them against the registry of the receiving process
+        return (Reference, (self.id, None))
+
     def __str__(self):
         return f"<ref {self.id}>"
 
     def __repr__(self):
         return str(self)
 
-
-
-@dataclass
+@dataclass(slots=True)
 class Documentation:
 
     long : List[Union[str, Reference]]
     short : List[Union[str, Reference]]
 
-@dataclass
+@dataclass(slots=True)
 class Object:
     
     id : Reference
@@ -174,7 +151,16 @@ class Object:
     def __post_init__(self):
         self.id.obj = self
 
-@dataclass 
+    def __getstate__(self):
+        return tuple(getattr(self, f.name) for f in fields(self))
+
+    def __setstate__(self, state):
+        # __post_init__ is not called when unpickling, rebind the reference here
+        for f, x in zip(fields(self), state):
+            object.__setattr__(self, f.name, x)
+        self.id.obj = self
+
+@dataclass(slots=True)
 class External(Object):
     id : Reference
     name : str
@@ -182,63 +168,60 @@ class External(Object):
     def get_parents(self):
         return []
 
-EXTERNAL_REF = Reference(Reference.EXTERNAL_ID, None)
-EXTERNAL_REF.obj = External(EXTERNAL_REF, "External", "external")
 
-@dataclass
+@dataclass(slots=True)
 class Member(Object):
 
     name: str
     kind: str
     protection: str
-    modifier: List[str] # TODO
+    modifier: Tuple[str, ...] # TODO
     docstring: Documentation
 
     @_parse_decorate
     def parse(x):
         kind = get_kind(x)
-        if kind == 'variable':
-            return Variable.parse(x)
+        if kind == 'variable' or kind == 'property':
+            return Variable.parse(x, fields=extract(x, MEMBER_FIELDS))
         elif kind == 'function':
-            return Function.parse(x)
-        elif kind == 'property':
-            return Variable.parse(x)
+            return Function.parse(x, fields=extract(x, MEMBER_FIELDS))
         else:
             raise NotImplementedError(f"TODO? {kind}")
 
-@dataclass
+@dataclass(slots=True)
 class Variable(Member): 
 
     type : str
     @_parse_decorate
-    def parse(x):
-        (*modifiers, type) = get_type(x).split(" ") # hmm...
-        #modifiers = modifiers if len(modifiers) > 0 else []
-
-        return Variable(get_id(x), get_name(x), get_kind(x), get_protection(x), modifiers, 
-                get_documentation(x), type)
+    def parse(x, fields=None):
+        fields = fields if fields is not None else extract(x, MEMBER_FIELDS)
+        (*modifiers, type) = fields.get('type', "").split(" ") # hmm...
+        modifiers = tuple(intern(m) for m in modifiers)
+        return Variable(get_id(x), fields['name'], get_kind(x), get_protection(x), modifiers, 
+                get_documentation(fields), intern(type))
 
     @property
     def definition(self):
         return ' '.join([self.protection, *self.modifier, self.type, self.name])
 
-@dataclass
+@dataclass(slots=True)
 class Function(Member):
     
     args : List[Tuple[str, str]]
     @_parse_decorate
-    def parse(x):
-        modifiers = get_type(x)
-        modifiers = modifiers.split(" ") if len(modifiers) > 0 else []
-        return Function(get_id(x), get_name(x), get_kind(x), get_protection(x), modifiers, 
-                get_documentation(x), get_arguments(x))
+    def parse(x, fields=None):
+        fields = fields if fields is not None else extract(x, MEMBER_FIELDS)
+        modifiers = fields.get('type', "")
+        modifiers = tuple(intern(m) for m in modifiers.split(" ")) if len(modifiers) > 0 else ()
+        return Function(get_id(x), fields['name'], get_kind(x), get_protection(x), modifiers, 
+                get_documentation(fields), fields['args'])
 
     @property
     def definition(self):
         definition = ' '.join([self.protection, *self.modifier, self.name])
         return f"{definition}{self.args}"
 
-@dataclass
+@dataclass(slots=True)
 class Compound(Object): 
     
     _name: str
@@ -249,26 +232,32 @@ class Compound(Object):
     namespace: Reference
     inherit_from: List[Reference]
     inherit_by: List[Reference]
-    template: List[str]
+    template: Tuple[str, ...]
     members: List[Reference]
+    _full_name: str = field(default=None, init=False, repr=False, compare=False)
+    source: str = field(default=None, repr=False, compare=False) # file to load members and documentation from (see load)
 
     @property
     def name(self):
-        if len(self.template) > 0:
-            return self._name + f"&lt;{','.join(self.template)}&gt;" # this might have to be refactored ...s
-        return self._name
+        if self._full_name is None:
+            if len(self.template) > 0:
+                self._full_name = self._name + f"&lt;{','.join(self.template)}&gt;" # this might have to be refactored ...s
+            else:
+                self._full_name = self._name
+        return self._full_name
 
     @_parse_decorate
     def parse(x):
-        members = [Member.parse(m) for m in get_members(x)]
-        return Compound(get_id(x), get_name(x), get_kind(x), get_protection(x), get_documentation(x), 
-                        get_path(x), GLOBAL_NAMESPACE.id, get_inherit_from(x), get_inherit_by(x), get_template(x),
-                        members)
+        fields = extract(x, COMPOUND_FIELDS)
+        members = [Member.parse(m) for m in fields.get('members', ())]
+        return Compound(get_id(x), fields['name'], get_kind(x), get_protection(x), get_documentation(fields), 
+                        fields['path'], SymbolTable.current().global_namespace.id, fields.get('inherit_from', []), 
+                        fields.get('inherit_by', []), fields.get('template', ()), members)
 
     def get_parents(self):
         return [self.namespace, *self.namespace.obj.get_parents()]
 
-@dataclass
+@dataclass(slots=True)
 class Namespace(Object): 
 
     name: str
@@ -277,27 +266,80 @@ class Namespace(Object):
     parent: Reference
     namespaces: List[Reference]
     classes: List[Reference]
+    source: str = field(default=None, repr=False, compare=False) # file to load documentation from (see load)
 
     @_parse_decorate
     def parse(x):
         assert x.attrib[KIND] == NAMESPACE
-        classes = [Reference(str(c.attrib['refid']), None) for c in x.findall('innerclass')]
-        namespaces = [Reference(str(c.attrib['refid']), None) for c in x.findall('innernamespace')]
-        return Namespace(get_id(x), get_name(x),  get_kind(x), get_documentation(x), GLOBAL_NAMESPACE.id, namespaces, classes)
+        fields = extract(x, COMPOUND_FIELDS)
+        return Namespace(get_id(x), fields['name'],  get_kind(x), get_documentation(fields), SymbolTable.current().global_namespace.id, 
+                         fields.get('namespaces', []), fields.get('classes', []))
 
     def get_compounds(self):
         return self.classes
 
     def get_parents(self):
         def parents(x):
-            while x.obj.parent is not None:
+            while getattr(x.obj, 'parent', None) is not None: # an External parent (not selected) ends the chain
                 x = x.obj.parent
                 yield x
         return [x for x in parents(self.id)]
 
-GLOBAL_NAMESPACE = Namespace(Reference('namespace__Global', None), "Global", "namespace", Documentation(["Global namespace."],[]), None, [], [])
+_SYMBOL_TABLE = contextvars.ContextVar("symbol_table", default=None)
+
+class SymbolTable:
+    """ 
+        Owns all references created during a build, references are unique by id within a table. Use as a context manager to make 
+        it the current table, the table is cleared on exit so that nothing outlives the build except what the caller keeps.
+
+        with SymbolTable() as symbols:
+            objects = objectify(path)
+            markdownify(objects)
+    """
 
-@dataclass 
+    def __init__(self):
+        self.references = {}
+        self.entries = None # index.xml entries (see scan_index), used to name references that are resolved after objectify (see load, update)
+        self._tokens = []
+        self.external = self.reference(Reference.EXTERNAL_ID, None)
+        External(self.external, "External", "external")
+        self.global_namespace = Namespace(self.reference(GLOBAL_ID, None), GLOBAL_NAME, "namespace", 
+                                          Documentation(["Global namespace."],[]), None, [], [])
+
+    def reference(self, id, obj):
+        id = id.strip()
+        if len(id) == 0: # an empty id means the ref could not be found, use EXTERNAL
+            id = Reference.EXTERNAL_ID 
+        instance = self.references.get(id, None)
+        if instance is None:
+            instance = object.__new__(Reference)
+            instance.id, instance.obj = id, obj
+            self.references[id] = instance
+        return instance
+
+    def unresolved(self):
+        return [ref for ref in self.references.values() if ref.obj is None]
+
+    def clear(self):
+        self.references.clear()
+
+    def __enter__(self):
+        self._tokens.append(_SYMBOL_TABLE.set(self))
+        return self
+
+    def __exit__(self, *args):
+        _SYMBOL_TABLE.reset(self._tokens.pop())
+        if len(self._tokens) == 0:
+            self.clear()
+
+    @classmethod
+    def current(cls):
+        table = _SYMBOL_TABLE.get()
+        if table is None:
+            raise RuntimeError("No current symbol table, use 'with SymbolTable():'.")
+        return table
+
+@dataclass(slots=True)
 class Directory(Object):
 
     path: str
@@ -308,9 +350,9 @@ class Directory(Object):
     def parse(x):
         assert x.attrib['kind'] == DIRECTORY
         files = [str(f.text) for f in x.findall(FILE)]
-        return Directory(get_id(x), get_path(x), get_documentation(x), files)
+        return Directory(get_id(x), get_path(x), get_documentation(extract(x, COMPOUND_FIELDS)), files)
 
-@dataclass
+@dataclass(slots=True)
 class File(Object):
 
     path: str
@@ -323,8 +365,13 @@ class Index:
 
     @_parse_decorate
     def parse(x):
+        return Index.build([(Reference(z.attrib['refid'], None), z.attrib[KIND].strip()) for z in get_backend().findall(x, 'compound')])
+
+    def build(all):
+        """ 
+            Group (reference, kind) pairs by kind.
+        """
         result = dict()
-        all = [(Reference(z.attrib['refid'], None), z.attrib[KIND].strip()) for z in x.findall('compound')]
         key_l =  lambda y : y[1]
         for key, group in itertools.groupby(sorted(all, key=key_l), key=key_l):
             result[key] = [x[0] for x in group]
@@ -352,17 +399,198 @@ def parse_documentation(x):
     #print(x, doc)
     return doc
 
-def parse(file):
+FIRST, APPEND, EXTEND = 0, 1, 2 # how a field is filled from the children of an element (see extract)
+
+def _text(x):
+    return intern(x.text)
+
+def _type(x):
+    return x.text if x.text is not None else "" # if theres not text, probably a constructor or something...
+
+def _location(x):
+    return intern(x.attrib[FILE])
+
+def _reference(x):
+    return Reference(str(x.attrib['refid']), None)
+
+def _base(x):
+    if 'refid' in x.keys():
+        return Reference(str(x.attrib['refid']), None)
+    return Reference(Reference.EXTERNAL_ID, None) # The reference is external, there is not link to it...
+
+def _template(x):
+    # TODO more complex template doc requires inspecting source xml file...
+    return tuple(intern(t.find('type').text) for t in x)
+
+def _members(x):
+    return [m for m in x if m.tag == MEMEBER and m.attrib[PROTECTION] != 'private'] # non-private members
+
+# tag -> (field, mode, extractor) of the children of a memberdef and of a compounddef
+MEMBER_FIELDS = {
+    NAME2 : ('name', FIRST, _text),
+    'type' : ('type', FIRST, _type),
+    'argsstring' : ('args', FIRST, _text),
+    DOC_SHORT : ('brief', FIRST, parse_documentation),
+    DOC_LONG : ('detailed', FIRST, parse_documentation),
+}
+COMPOUND_FIELDS = {
+    NAME : ('name', FIRST, _text),
+    DOC_SHORT : ('brief', FIRST, parse_documentation),
+    DOC_LONG : ('detailed', FIRST, parse_documentation),
+    'location' : ('path', FIRST, _location),
+    'basecompoundref' : ('inherit_from', APPEND, _base),
+    'derivedcompoundref' : ('inherit_by', APPEND, _reference),
+    'templateparamlist' : ('template', FIRST, _template),
+    SECTION : ('members', EXTEND, _members),
+    'innerclass' : ('classes', APPEND, _reference),
+    'innernamespace' : ('namespaces', APPEND, _reference),
+}
+
+def extract(x, table):
+    """ 
+        Extract the fields of an element in a single pass over its children, each child is dispatched by tag to the extractor of
+        its field in table (see MEMBER_FIELDS and COMPOUND_FIELDS). A FIRST field takes the first matching child (as find does),
+        APPEND and EXTEND fields collect every matching child in document order. Missing fields are absent from the result.
+    """
+    fields = {}
+    for child in x:
+        entry = table.get(child.tag, None)
+        if entry is None:
+            continue
+        field, mode, extractor = entry
+        if mode == FIRST:
+            if field not in fields:
+                fields[field] = extractor(child)
+        elif mode == APPEND:
+            fields.setdefault(field, []).append(extractor(child))
+        else:
+            fields.setdefault(field, []).extend(extractor(child))
+    return fields
+
+def read(file, skip=None):
+    """ 
+        Read an xml file and return its root element. If skip is given, subtrees with a tag in skip are dropped after reading 
+        (see the strip method of the backend), at least those that are children of a compounddef.
+    """
+    return get_backend().parse(file, skip=skip)
+
+IndexEntry = namedtuple("IndexEntry", ["kind", "name"])
+
+def scan_index(file):
+    """ 
+        Stream index.xml and return a dict mapping each compound and member refid to its IndexEntry (kind, name).
+    """
+    entries = {}
+    for x in get_backend().iterparse(file, ('member', 'compound')):
+        if x.tag == 'member':
+            entries[x.attrib['refid']] = IndexEntry(intern(x.attrib[KIND].strip()), intern(x.find(NAME2).text))
+        elif x.tag == 'compound':
+            entries[x.attrib['refid']] = IndexEntry(intern(x.attrib[KIND].strip()), intern(x.find(NAME2).text))
+            x.clear()
+    return entries
+
+def parse_combined(file, skip=None, skip_kinds=()):
+    """ 
+        Stream a combined xml file (all compounds in a single document, see combine.xslt) and parse each compounddef as it 
+        closes, the element is discarded afterwards so that only one compound is held in memory at a time (see the stream 
+        method of the backend). The index is built from the compounds found, in document order.
+
+        Returns:
+            dict: parsed objects by compound id, including 'index'.
+    """
+    Log.log(f"PARSING {file}")
+    result, all = {}, []
+    backend = get_backend()
+    for x in backend.stream(file, 'compounddef'):
+        kind = x.attrib[KIND].strip()
+        if kind in skip_kinds:
+            continue
+        if skip:
+            backend.strip(x, skip)
+        result[x.attrib[ID]] = PARSERS[str(x.tag)](x)
+        all.append((Reference(x.attrib[ID], None), kind))
+    result['index'] = Index.build(all)
+    return result
+
+def parse(file, skip=None, lazy=False):
+    """ 
+        Parse a doxygen xml file. If lazy, the members and documentation of compounds and namespaces are not parsed until 
+        they are loaded (see load).
+    """
     Log.log(f"PARSING {file}")
-    obj = ET.parse(file).getroot()
+    obj = read(file, skip=LAZY_SKIP_TAGS if lazy else skip)
     if obj.tag == "doxygen":
         parsed = []
         for child in obj:
             parsed.append(PARSERS[str(child.tag)](child))
         assert len(parsed) == 1 # more than one compounddef found? hmmm
+        if lazy and isinstance(parsed[0], (Compound, Namespace)):
+            parsed[0].source = intern(str(file))
+            if isinstance(parsed[0], Compound):
+                parsed[0].members = None
         return parsed[0]
     elif obj.tag == "doxygenindex":
         return Index.parse(obj)
+
+def _detach(doc, symbols):
+    # references to anything other than a compound or namespace are replaced by external references that are not in the 
+    # symbol table, so that a page renders the same regardless of which other compounds are loaded at the time
+    for x in (doc.short, doc.long):
+        for i, y in enumerate(x.doc):
+            if isinstance(y, Reference) and (y.obj is None or isinstance(y.obj, Member)):
+                if y.obj is None and symbols.references.get(y.id, None) is y:
+                    del symbols.references[y.id]
+                entry = symbols.entries.get(y.id, None) if symbols.entries is not None else None
+                ref = object.__new__(Reference)
+                ref.id, ref.obj = y.id, None
+                x.doc[i] = External(ref, entry.name if entry is not None else y.id, entry.kind if entry is not None else "external")
+    return doc
+
+def load(obj):
+    """ 
+        Parse the members and documentation of a lazily parsed compound or namespace (see objectify lazy). Must be called in 
+        the symbol table of the build.
+
+        Returns:
+            bool: whether obj was loaded by this call, in which case it should be unloaded when it is no longer needed.
+    """
+    if getattr(obj, 'source', None) is None or obj.docstring is not None:
+        return False
+    symbols = SymbolTable.current()
+    full = parse(obj.source, skip=SKIP_TAGS)
+    obj.id.obj = obj # parsing rebinds the reference to the new object
+    obj.docstring = _detach(full.docstring, symbols)
+    if isinstance(obj, Compound):
+        obj.members = full.members
+        for member in obj.members:
+            member.docstring = _detach(member.docstring, symbols)
+    return True
+
+def unload(obj):
+    """ 
+        Drop the members and documentation of a loaded compound or namespace (see load).
+    """
+    if getattr(obj, 'source', None) is None:
+        return
+    if isinstance(obj, Compound) and obj.members is not None:
+        references = SymbolTable.current().references
+        for member in obj.members:
+            if references.get(member.id.id, None) is member.id:
+                del references[member.id.id]
+        obj.members = None
+    obj.docstring = None
+
+@contextlib.contextmanager
+def loaded(ref):
+    """ 
+        Load the object of ref for the duration of the context (see load), does nothing if it is already loaded.
+    """
+    loaded = load(ref.obj)
+    try:
+        yield ref.obj
+    finally:
+        if loaded:
+            unload(ref.obj)
     
 PARSERS = {
     "compounddef":parse_compounddef,
@@ -385,16 +613,160 @@ PARSERS = {
 def files(path):
     yield from sorted(glob.glob(str(pathlib.Path(path, "*.xml")), recursive=True))
 
-def objectify(path):
-    path = pathlib.Path(path).resolve()
-    result = {}
-    for file in files(path):
-        result[pathlib.Path(file).with_suffix('').name] = parse(file)
+def enclosing_namespace(name, namespaces):
+    """ 
+        Name of the namespace that encloses the compound/namespace called name, namespaces is the set of all namespace names.
+    """
+    while "::" in name:
+        name = name.rpartition("::")[0]
+        if name in namespaces:
+            return name
+    return GLOBAL_NAME
+
+def select_namespaces(index, patterns):
+    """ 
+        Names of the namespaces selected by patterns (glob patterns, see fnmatch), a selected namespace includes all of its descendants. 
+        
+        Args:
+            index (dict): index.xml entries, see scan_index.
+            patterns (list): namespace name patterns, "Global" selects everything.
+    """
+    namespaces = {e.name for e in index.values() if e.kind == NAMESPACE}
+    tree = {GLOBAL_NAME : []}
+    for name in namespaces:
+        tree.setdefault(enclosing_namespace(name, namespaces), []).append(name)
+    stack = [n for n in [GLOBAL_NAME, *namespaces] if any(fnmatch.fnmatchcase(n, p) for p in patterns)]
+    selected = set()
+    while len(stack) > 0:
+        name = stack.pop()
+        if name not in selected:
+            selected.add(name)
+            stack.extend(tree.get(name, []))
+    return selected
+
+def select(path, index=None, selective=False, namespaces=None):
+    """ 
+        Files in path to parse. Compounds are left out according to their index.xml entry: if selective, those whose kind is in SKIP_KINDS;
+        if namespaces is given (see select_namespaces), those whose kind is in SKIP_KINDS (they are not rendered with a namespace 
+        filter) and namespaces and compounds that are not in a selected namespace.
+    """
+    all_files = files(path)
+    if index is None:
+        yield from all_files
+        return
+    all_namespaces = {e.name for e in index.values() if e.kind == NAMESPACE}
+    for file in all_files:
+        entry = index.get(pathlib.Path(file).with_suffix('').name, None)
+        if entry is None or keep(entry, all_namespaces, selective=selective, namespaces=namespaces):
+            yield file
+
+def keep(entry, all_namespaces, selective=False, namespaces=None):
+    """ 
+        Whether the compound with the given IndexEntry should be parsed, see select.
+    """
+    if (selective or namespaces is not None) and entry.kind in SKIP_KINDS:
+        return False
+    if namespaces is not None:
+        if entry.kind == NAMESPACE:
+            return entry.name in namespaces
+        elif entry.kind in COMPOUND_KINDS:
+            return enclosing_namespace(entry.name, all_namespaces) in namespaces
+    return True
+
+def select_combined(result, namespaces):
+    """ 
+        Namespace selection for a parsed combined xml file, there is no index.xml to select from before parsing so compounds that 
+        are not selected are dropped from result after the fact.
+
+        Returns:
+            (dict, set): index entries (see scan_index) built from the parsed objects and the selected namespace names.
+    """
+    entries = {}
+    for kind, refs in result['index'].__dict__.items():
+        for ref in refs:
+            if kind == NAMESPACE:
+                entries[ref.id] = IndexEntry(kind, ref.obj.name)
+            elif kind in COMPOUND_KINDS:
+                entries[ref.id] = IndexEntry(kind, ref.obj._name)
+                entries.update((m.id.id, IndexEntry(m.kind, m.name)) for m in ref.obj.members)
+    selected = select_namespaces(entries, namespaces)
+    all_namespaces = {e.name for e in entries.values() if e.kind == NAMESPACE}
+    for id in [id for id in result if id in entries and not keep(entries[id], all_namespaces, namespaces=selected)]:
+        obj = result.pop(id)
+        obj.id.obj = None
+        for m in getattr(obj, 'members', []):
+            m.id.obj = None
+    return entries, selected
+
+def _parse_worker(file, skip=None, backend=None, lazy=False):
+    # each file gets its own table so that worker memory does not grow. The result is returned pickled so that it is 
+    # unpickled by the caller (in the current symbol table) rather than by the executor's result thread.
+    if backend is not None and get_backend().name != backend:
+        set_backend(backend)
+    start = time.perf_counter()
+    with SymbolTable():
+        data = pickle.dumps(parse(file, skip=skip, lazy=lazy), protocol=pickle.HIGHEST_PROTOCOL)
+    return data, start, time.perf_counter() - start, os.getpid()
+
+def parse_files(files, workers=None, skip=None, cache=None, lazy=False):
+    """ 
+        Parse each file, yielding (file, parsed) pairs in the order given. If workers > 1 the files are parsed in a process pool,
+        parsed objects are sent back to this process and their references are resolved against the registry here. If a cache 
+        (ParseCache) is given, unchanged files are loaded from it and newly parsed files are added to it.
+    """
+    files = list(files)
+    parsed = {}
+    if cache is not None:
+        for file in files:
+            hit, obj = cache.get(file)
+            if hit:
+                parsed[file] = obj
+    missing = [file for file in files if file not in parsed]
+
+    if workers is None or workers <= 1 or len(missing) <= 1:
+        for file in missing:
+            start = time.perf_counter()
+            parsed[file] = parse(file, skip=skip, lazy=lazy)
+            profile.item("parse", file, time.perf_counter() - start, start=start)
+    else:
+        chunksize = max(1, len(missing) // (workers * 4))
+        _parse = functools.partial(_parse_worker, skip=skip, backend=get_backend().name, lazy=lazy)
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            for file, (data, start, seconds, pid) in zip(missing, pool.map(_parse, missing, chunksize=chunksize)):
+                parsed[file] = pickle.loads(data)
+                profile.item("parse", file, seconds, start=start, pid=pid)
+    if profile.profiling():
+        profile.count(files_read=len(missing), bytes_read=sum(os.path.getsize(file) for file in missing))
+
+    if cache is not None:
+        for file in missing:
+            cache.put(file, parsed[file])
+        cache.save()
+    for file in files:
+        yield file, parsed[file]
+
+def resolve(index, symbols, entries=None, selected=None):
+    """ 
+        Post process the parsed objects of a build: link namespaces and their compounds, populate the global namespace and resolve 
+        references to compounds that were not read.
+
+        Args:
+            index (SimpleNamespace): parsed index.xml.
+            symbols (SymbolTable): symbol table of the build.
+            entries (dict, optional): index.xml entries (see scan_index) used to name unresolved references.
+            selected (set, optional): names of the selected namespaces (see select_namespaces).
+    """
+    global_namespace = symbols.global_namespace
+    # drop references to compounds that were not parsed
+    for k, v in index.__dict__.items():
+        index.__dict__[k] = [x for x in v if x.obj is not None]
+    for namespace in index.__dict__.get('namespace', []):
+        namespace.obj.classes = [x for x in namespace.obj.classes if x.obj is not None]
+        namespace.obj.namespaces = [x for x in namespace.obj.namespaces if x.obj is not None]
 
     # post process namespaces
-    index = result['index']
     namespaces = index.__dict__.get('namespace', [])
-    namespaces = index.__dict__['namespace'] = [GLOBAL_NAMESPACE.id, *sorted(namespaces, key=lambda x: x.obj.name)]
+    namespaces = index.__dict__['namespace'] = [global_namespace.id, *sorted(namespaces, key=lambda x: x.obj.name)]
 
     for namespace in namespaces:
         # set namespace of all compounds in the namespace
@@ -403,14 +775,123 @@ def objectify(path):
         for x in namespace.obj.namespaces:
             x.obj.parent = namespace
 
+    # a namespace whose parent was not read (see select_namespaces) is nested in it by name, the parent is external
+    if entries is not None:
+        ids = {e.name : id for id, e in entries.items() if e.kind == NAMESPACE}
+        for namespace in namespaces[1:]:
+            if namespace.obj.parent is global_namespace.id:
+                parent = enclosing_namespace(namespace.obj.name, ids)
+                if parent != GLOBAL_NAME:
+                    namespace.obj.parent = symbols.reference(ids[parent], None)
+
     # resolve global namespace for all compounds TODO
-    GLOBAL_NAMESPACE.namespaces = namespaces[1:]
+    global_namespace.namespaces = namespaces[1:]
     for cls in index.__dict__.get('class', []):
-        if cls.obj.namespace == GLOBAL_NAMESPACE.id:
-            GLOBAL_NAMESPACE.classes.append(cls)
+        if cls.obj.namespace == global_namespace.id:
+            global_namespace.classes.append(cls)
     for cls in index.__dict__.get('interface', []):
-        if cls.obj.namespace == GLOBAL_NAMESPACE.id:
-            GLOBAL_NAMESPACE.classes.append(cls)
-
-    return result
-
+        if cls.obj.namespace == global_namespace.id:
+            global_namespace.classes.append(cls)
+
+    if selected is not None and GLOBAL_NAME not in selected:
+        index.namespace = namespaces[1:]
+
+    # anything still unresolved was not read (or is private), it is named using index.xml and treated as external
+    if entries is not None:
+        for ref in symbols.unresolved():
+            entry = entries.get(ref.id, IndexEntry("external", ref.id))
+            External(ref, entry.name, entry.kind)
+
+def update(result, parsed, symbols):
+    """
+        Replace compounds and namespaces of a resolved model (see objectify) by newly parsed versions, e.g. after their xml files
+        changed. The new objects must have been parsed in the symbol table of the model, and index.xml must be unchanged (no
+        compound was added, removed, renamed or moved to another namespace), otherwise the model should be built again.
+
+        Args:
+            result (dict): resolved model, see objectify.
+            parsed (dict): newly parsed objects by their key in result.
+            symbols (SymbolTable): symbol table of the model.
+    """
+    for key, obj in parsed.items():
+        old = result[key]
+        if isinstance(obj, Compound):
+            obj.namespace = old.namespace
+            members = set(m.id.id for m in obj.members or ())
+            for member in old.members or ():
+                if member.id.id not in members and member.id.obj is member:
+                    member.id.obj = None # removed, references to it are unresolved as they would be in a new build
+        elif isinstance(obj, Namespace):
+            obj.parent = old.parent
+        result[key] = obj
+    # drop references to compounds that were not parsed, they were made external (or left unresolved) by resolve
+    for obj in parsed.values():
+        if isinstance(obj, Namespace):
+            obj.classes = [x for x in obj.classes if x.obj is not None and not isinstance(x.obj, External)]
+            obj.namespaces = [x for x in obj.namespaces if x.obj is not None and not isinstance(x.obj, External)]
+    if symbols.entries is not None:
+        for ref in symbols.unresolved():
+            entry = symbols.entries.get(ref.id, IndexEntry("external", ref.id))
+            External(ref, entry.name, entry.kind)
+
+def objectify(path, workers=None, selective=False, namespaces=None, cache_dir=None, cache_size=DEFAULT_CACHE_SIZE, symbols=None, backend=None, cache=None, lazy=False):
+    """ 
+        Parse the doxygen xml files in path. 
+
+        Args:
+            path (str): directory containing the doxygen xml files, or a single combined xml file (see combine.xslt) which is 
+                streamed one compound at a time. workers and cache_dir do not apply to a combined file.
+            workers (int, optional): number of worker processes used to parse files. Defaults to None (parse in this process).
+            selective (bool, optional): skip compound kinds that are never rendered (see SKIP_KINDS) and drop unused subtrees 
+                (see SKIP_TAGS) while reading. Defaults to False.
+            namespaces (list, optional): namespaces to include (glob patterns), each includes its nested namespaces. Compounds 
+                outside of them are never read, nor are file and dir compounds (see SKIP_KINDS). Defaults to None (all namespaces).
+            cache_dir (str, optional): directory of a persistent parse cache (see ParseCache), only files that have changed since 
+                they were cached are parsed. Defaults to None (no cache).
+            cache_size (int, optional): maximum size of the parse cache in bytes.
+            symbols (SymbolTable, optional): symbol table that will own the references. Defaults to the current table, or a new 
+                table for this call if there is none.
+            backend (str, optional): xml parser backend, "etree" or "lxml" (see set_backend). Defaults to None (the current 
+                backend, etree unless set).
+            cache (ParseCache, optional): parse cache to use instead of cache_dir, e.g. a MemoryCache. Defaults to None.
+            lazy (bool, optional): only read names, kinds, namespaces and inheritance, the members and documentation of each 
+                compound are parsed when its page is rendered and dropped afterwards (see load). The model must be rendered 
+                within the same symbol table (with SymbolTable(): ...). Does not apply to a combined file. Defaults to False.
+    """
+    if backend is not None:
+        set_backend(backend)
+    path = pathlib.Path(path).resolve()
+    symbols = symbols if symbols is not None else (_SYMBOL_TABLE.get() or SymbolTable())
+    with profile.phase("objectify"):
+        if path.is_file():
+            with symbols:
+                with profile.phase("parse"):
+                    result = parse_combined(path, skip=SKIP_TAGS if selective else None, skip_kinds=SKIP_KINDS if selective or namespaces is not None else ())
+                    profile.count(files_read=1, bytes_read=path.stat().st_size)
+                with profile.phase("filter"):
+                    entries, selected = select_combined(result, namespaces) if namespaces is not None else (None, None)
+                with profile.phase("resolve"):
+                    resolve(result['index'], symbols, entries=entries, selected=selected)
+            return result
+
+        with profile.phase("filter"):
+            index_file = pathlib.Path(path, "index.xml")
+            entries = scan_index(index_file) if (selective or lazy or namespaces is not None) and index_file.exists() else None
+            selected = select_namespaces(entries, namespaces) if entries is not None and namespaces is not None else None
+            selected_files = select(path, index=entries, selective=selective, namespaces=selected)
+
+        result = {}
+        skip = SKIP_TAGS if selective else None
+        if lazy and (cache is not None or cache_dir is not None):
+            Log.warn("The parse cache is not used with lazy parsing.") # lazily and fully parsed objects are not interchangeable
+            cache = None
+        elif cache is None and cache_dir is not None:
+            cache = ParseCache(cache_dir, max_size=cache_size)
+        with symbols:
+            with profile.phase("parse"):
+                for file, parsed in parse_files(selected_files, workers=workers, skip=skip, cache=cache, lazy=lazy):
+                    result[pathlib.Path(file).with_suffix('').name] = parsed
+            with profile.phase("resolve"):
+                resolve(result['index'], symbols, entries=entries, selected=selected)
+            symbols.entries = entries
+        return result
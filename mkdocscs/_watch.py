@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+   Created on 18-10-2026
+"""
+__author__ = "Benedict Wilkins"
+__email__ = "benrjw@gmail.com"
+__status__ = "Development"
+
+import time
+import pathlib
+import contextlib
+
+from .utils import Log
+from ._cache import MemoryCache, file_hash
+from ._objectify import objectify, update, parse, files, SymbolTable, SKIP_TAGS
+from .markdownify import markdownify
+
+def snapshot(path):
+    """
+        Size and mtime of each xml file in path (or of path itself if it is a combined xml file).
+    """
+    path = pathlib.Path(path)
+    state = {}
+    for file in ([path] if path.is_file() else files(path)):
+        try:
+            stat = pathlib.Path(file).stat()
+            state[str(file)] = (stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            pass # removed while listing
+    return state
+
+def affected(changed, dependencies):
+    """
+        Ids of the pages to render given the ids of the changed compounds, None if every page should be rendered.
+    """
+    if "index" in changed:
+        return None # compounds were added, removed or renamed
+    return set(changed).union(id for id, depends in dependencies.items() if not depends.isdisjoint(changed))
+
+class WatchedModel:
+    """
+        A model built by objectify that is kept resolved, in its symbol table, between the builds of watch. Compounds whose xml 
+        file changed are parsed again and patched into the model (see update). The model is built again if index.xml changed 
+        (compounds were added, removed or renamed), if files were added or removed, or if path is a combined xml file, unchanged 
+        files are then loaded from a MemoryCache.
+    """
+
+    def __init__(self, path, **kwargs):
+        self.path = pathlib.Path(path).resolve()
+        self.kwargs = kwargs
+        self.cache = MemoryCache()
+        self.objects = None
+        self.symbols = None
+        self.state = {}
+        self.hashes = {} # content hash of the file of each object in the model
+        self._stack = contextlib.ExitStack()
+
+    def build(self):
+        """
+            Build the model again from the xml files.
+        """
+        self.close()
+        self.objects = None # built again on the next refresh if this fails
+        self.symbols = self._stack.enter_context(SymbolTable())
+        state = snapshot(self.path)
+        objects = objectify(str(self.path), cache=self.cache, symbols=self.symbols, **self.kwargs)
+        self.cache.changed.clear()
+        self.objects, self.state, self.hashes = objects, state, {}
+        if not self.path.is_file():
+            for key in self.objects:
+                file = str(pathlib.Path(self.path, key + ".xml"))
+                entry = self.cache.entries.get(file, None) # not cached if lazy
+                self.hashes[file] = entry['hash'] if entry is not None else file_hash(file)
+
+    def refresh(self):
+        """
+            Bring the model up to date with the xml files.
+
+            Returns:
+                set: ids of the compounds and namespaces that changed, None if the model was built again.
+        """
+        current = snapshot(self.path)
+        if self.objects is None or self.path.is_file() or current.keys() != self.state.keys():
+            for file in self.state.keys() - current.keys():
+                self.cache.remove(file)
+            self.build()
+            return None
+        hashes = {file : file_hash(file) for file, stat in current.items() if stat != self.state[file] and file in self.hashes}
+        changed = [file for file, digest in hashes.items() if digest != self.hashes[file]]
+        if any(pathlib.Path(file).stem == "index" for file in changed):
+            self.build()
+            return None
+        lazy, skip = self.kwargs.get('lazy', False), SKIP_TAGS if self.kwargs.get('selective', False) else None
+        with self.symbols:
+            parsed = {file : parse(file, skip=skip, lazy=lazy) for file in changed} # the model is unchanged if this fails
+            for file, obj in parsed.items():
+                if not lazy:
+                    self.cache.put(file, obj)
+            update(self.objects, {pathlib.Path(file).stem : obj for file, obj in parsed.items()}, self.symbols)
+        self.cache.changed.clear()
+        self.state = current
+        self.hashes.update(hashes)
+        return set(pathlib.Path(file).stem for file in changed)
+
+    def close(self):
+        self._stack.close()
+
+def watch(path, output="./docs", root_path="./docs", interval=0.25, objectify_kwargs=None, markdownify_kwargs=None):
+    """
+        Build the documentation then poll path for changes, rebuilding on each change. The resolved model is kept between builds
+        (see WatchedModel), only files whose content changed are parsed again and only the pages that depend on them are rendered.
+
+        Args:
+            path (str): doxygen xml directory, or a combined xml file (which is fully rebuilt on change).
+            output (str, optional): output directory. Defaults to "./docs".
+            root_path (str, optional): project root. Defaults to "./docs".
+            interval (float, optional): polling interval in seconds. Defaults to 0.25.
+            objectify_kwargs (dict, optional): arguments of objectify.
+            markdownify_kwargs (dict, optional): arguments of markdownify.
+    """
+    model = WatchedModel(path, **(objectify_kwargs or {}))
+    markdownify_kwargs = dict(markdownify_kwargs or {})
+    dependencies = {}
+
+    def build():
+        changed = model.refresh()
+        pages = affected(changed, dependencies) if changed is not None else None
+        if pages is not None and len(pages) == 0:
+            return pages # nothing changed
+        with model.symbols:
+            markdownify(model.objects, path=output, root_path=root_path, pages=pages, dependencies=dependencies, **markdownify_kwargs)
+        return pages
+
+    build()
+    state = snapshot(path)
+    Log.log(f"Watching {path} for changes...")
+    try:
+        while True:
+            time.sleep(interval)
+            current = snapshot(path)
+            if current == state:
+                continue
+            while True: # wait for doxygen to finish writing
+                time.sleep(interval)
+                latest = snapshot(path)
+                if latest == current:
+                    break
+                current = latest
+            start = time.perf_counter()
+            state = current
+            try:
+                pages = build()
+                if pages is None or len(pages) > 0:
+                    count = "all" if pages is None else len(pages)
+                    Log.log(f"Rebuilt {count} pages in {time.perf_counter() - start:.2f}s")
+            except Exception as e: # e.g. doxygen is still writing, rebuild on the next change
+                Log.warn(f"Rebuild failed: {e}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        model.close()
@@ -9,3 +9,4 @@ __status__ = "Development"
 
 from ._generate import Markdownify
 from ._markdownify import markdownify
+from ._output import OutputManifest, MemoryOutput
@@ -7,59 +7,100 @@ __author__ = "Benedict Wilkins"
 __email__ = "benrjw@gmail.com"
 __status__ = "Development"
 
+import io
 import pathlib
+import contextlib
+import contextvars
 from pprint import pprint
 
-from .._objectify import Member, Variable, Function, Compound, Namespace, Reference, Documentation
-
-_BASE_PATH = pathlib.Path('./docs')
-_ROOT_PATH = pathlib.Path('./docs')
+from .._objectify import Member, Variable, Function, Compound, Namespace, Reference, Documentation, External
+from ._names import NameTable
+from ._navigation import Navigation
+from ._inheritance import InheritedMember
+from ..utils import _profile as profile
+
+class RenderContext:
+    """ 
+        State shared by the pages of a build (paths, names, navigation and output), see Markdownify.context. Builds in 
+        different contexts (e.g. threads) do not share state.
+    """
+
+    __slots__ = ("base_path", "root_path", "names", "navigation", "directories", "write", "output", "inheritance", "snapshot", "collect")
+
+    def __init__(self):
+        self.base_path = pathlib.Path('./docs')
+        self.root_path = pathlib.Path('./docs')
+        self.names = NameTable()
+        self.navigation = Navigation()
+        self.directories = set() # directories already created
+        self.write = True # write pages when they are closed, otherwise the text is kept in Markdownify.text
+        self.output = None # OutputManifest, pages are only written if their content changed
+        self.inheritance = None # InheritanceGraph, full base chains and inherited members are rendered if set
+        self.snapshot = {} # references to render by id, inherited by forked render workers (see render_pages)
+        self.collect = None # collect function of render_pages, inherited by forked render workers
+
+_CONTEXT = contextvars.ContextVar("render_context", default=RenderContext())
+
+def write_page(path, text):
+    context = _CONTEXT.get()
+    if context.output is not None:
+        return context.output.write(path, text)
+    path = pathlib.Path(path)
+    if path.parent not in context.directories:
+        path.parent.mkdir(parents=True, exist_ok=True) # make them if not already made...
+        context.directories.add(path.parent)
+    with open(path, "w") as f:
+        f.write(text)
+    profile.written(text)
+    return True
+
+def keep_page(path):
+    output = _CONTEXT.get().output
+    if output is not None:
+        output.keep(path)
 
 class Markdownify:
 
-    def __init__(self, path, navigation_title=None, navigation_file=".pages"):
-        path = pathlib.Path(_BASE_PATH, path)
+    def __init__(self, path, navigation_title=None, navigation=True):
+        self.context = _CONTEXT.get()
+        self.names = self.context.names
+        path = pathlib.Path(self.context.base_path, path)
         self.relative_path = self._relative_path(path) # use to create relative links...
         self.path = path.resolve()
-        self.path.parent.mkdir(parents=True, exist_ok=True) # make them if not already made...
-        self.navigation_file = navigation_file
         self.navigation_title = navigation_title
-        self._pages()
+        self.dependencies = set() # ids of the references rendered in this page
+        if isinstance(navigation, tuple): # a navigation entry, e.g. a Section of this page and its subpages
+            self.context.navigation.extend(self.path.parent, [navigation])
+        elif navigation:
+            self.context.navigation.add(self.path, self.navigation_title)
 
         self.MARKDOWNIFY = {
             str: lambda *args, **kwargs: args[0],
             Reference:self.markdownify_reference,
             Documentation:self.markdownify_documentation,
             Variable:self.markdownify_variable,
-            Function:self.markdownify_function}
+            Function:self.markdownify_function,
+            InheritedMember:self.markdownify_variable}
     
     def _relative_path(self, path):
         i = 0
-        while path.parent != _ROOT_PATH:
+        root_path = self.context.root_path
+        while path.parent != root_path:
             if path == path.parent:
-                raise ValueError("_ROOT_PATH {_ROOT_PATH} has been incorrectly set, failed to match with {self.path}.")
+                raise ValueError(f"Root path {root_path} has been incorrectly set, failed to match with {path}.")
             path = path.parent
             i += 1
         return "../"*i
 
-    def _pages(self):
-        path_pages = pathlib.Path(self.path.parent, self.navigation_file)
-        #print("PAGES:", path_pages)
-        if not path_pages.exists():
-            with path_pages.open('w') as f:
-                f.write("nav:\n")
-        with path_pages.open('a') as f:
-            if self.navigation_title is None:
-                f.write(f"    - '{self.path.name}'\n")
-            else:
-                f.write(f"    - '{self.navigation_title}' : '{self.path.name}'\n")
-        
     def __enter__(self):
-        self.file = open(str(self.path), "a")
+        self.file = io.StringIO() # pages are rendered in memory and written in one go
         return self
 
     def __exit__(self, *args):
+        self.text = self.file.getvalue()
         self.file.close()
+        if self.context.write:
+            write_page(self.path, self.text)
 
     def write(self, x):
         self.file.write(x)
@@ -74,6 +115,9 @@ class Markdownify:
         assert level > 0
         self.write(f"{'#' * level} {x}\n")
 
+    def anchor(self, id):
+        self.write(f'<a id="{id}"></a>\n')
+
     def list(self, elements, indent=0):
         for x in elements:
             if isinstance(x, (list, tuple)):
@@ -89,27 +133,40 @@ class Markdownify:
         return self.MARKDOWNIFY[type(x)](x, **kwargs)
 
     def markdownify_reference(self, ref : Reference, text=None, short=False):
-        if text is None:
-            if not short:
-                return self.markdownify_name(ref.obj)
-            else:
-                text = ref.obj.name.split("::")[-1]
-                # TODO make this relative link less hacky...
-                return f"[{text}]({self.relative_path}{ref.obj.kind.capitalize()}/{ref.id}/)" 
-        else:
-            # TODO make this relative link less hacky...
-            return f"[{text}]({self.relative_path}{ref.obj.kind.capitalize()}/{ref.id}/)" 
+        self.dependencies.add(ref.id)
+        if isinstance(ref.obj, External): # there is no page to link to
+            return text if text is not None else ref.obj.name
+        if text is None and not short:
+            return self.markdownify_name(ref.obj)
+        return self.names.link(ref, self.relative_path, text=text)
    
+    def link_target(self, target, text):
+        return f"[{text}]({self.relative_path}{target})"
+
     def markdownify_documentation(self, doc : Documentation):
         short = "".join([self.markdownify(x) for x in doc.short])
         long = "".join([self.markdownify(x) for x in doc.long])
         return f"{short}\n\n{long}\n"
 
     def markdownify_name(self, obj): # get the name with embedded links to namespaces/parent compounds
-        parents = list(reversed(obj.get_parents()[:-1])) # ignore global namespace
-        names = [*parents, obj.id]
-        linked_name = "::".join(self.markdownify_reference(n, short=True) for n in names)
-        return linked_name
+        self.dependencies.add(obj.id.id)
+        self.dependencies.update(p.id for p in self.names.name(obj.id).parents)
+        return self.names.linked_name(obj.id, self.relative_path)
+
+    def sort_key(self, ref):
+        return self.names.sort_key(ref)
+
+    def grouped(self, namespace): # compounds rendered as sections of the namespace page
+        return self.names.groups.get(namespace.id, [])
+
+    def inheritance(self): # InheritanceGraph of the build, None if inherited members are not rendered
+        return self.context.inheritance
+
+    def subpages(self, cls): # member kinds rendered on subpages of the compound page, None if there are none
+        return self.names.subpages.get(cls.id, None)
+
+    def subpage(self, cls, kind):
+        return self.names.subpage(cls, kind)
 
     def markdownify_variable(self, obj):
         return f"```{obj.definition}```"
@@ -117,12 +174,55 @@ class Markdownify:
     def markdownify_function(self, obj):
         return f"```{obj.definition}```"
 
+    @classmethod
+    @contextlib.contextmanager
+    def new_context(cls):
+        """
+            Make a new render context current for the duration of the context, markdownify renders each build in its own context.
+        """
+        token = _CONTEXT.set(RenderContext())
+        try:
+            yield _CONTEXT.get()
+        finally:
+            _CONTEXT.reset(token)
+
+    @classmethod
+    def current_context(cls):
+        return _CONTEXT.get()
+
+    @classmethod
+    def set_context(cls, context):
+        """
+            Make context current in this thread, e.g. in a worker process that renders pages of the build (see render_pages).
+        """
+        _CONTEXT.set(context)
+
     @classmethod
     def set_base_path(cls, path):
-        global _BASE_PATH
-        _BASE_PATH = pathlib.Path(path)
+        _CONTEXT.get().base_path = pathlib.Path(path)
 
     @classmethod
     def set_root_path(cls, path):
-        global _ROOT_PATH
-        _ROOT_PATH = pathlib.Path(path)
\ No newline at end of file
+        _CONTEXT.get().root_path = pathlib.Path(path)
+
+    @classmethod
+    def set_names(cls, names):
+        _CONTEXT.get().names = names
+
+    @classmethod
+    def set_inheritance(cls, inheritance):
+        _CONTEXT.get().inheritance = inheritance
+
+    @classmethod
+    def set_output(cls, output):
+        _CONTEXT.get().output = output
+
+    @classmethod
+    def set_write(cls, write):
+        _CONTEXT.get().write = write
+
+    @classmethod
+    def set_navigation(cls, navigation):
+        context = _CONTEXT.get()
+        context.navigation = navigation
+        context.directories.clear()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+   Created on 18-10-2026
+"""
+__author__ = "Benedict Wilkins"
+__email__ = "benrjw@gmail.com"
+__status__ = "Development"
+
+from collections import deque
+from dataclasses import dataclass
+
+from .._objectify import Compound, loaded
+from ..utils import Log
+
+@dataclass(slots=True)
+class InheritedMember:
+    """ 
+        A member as listed on the pages of derived compounds, only its definition is kept (see InheritanceGraph).
+    """
+    owner: object # Reference of the compound that declares the member
+    name: str
+    kind: str
+    definition: str
+
+def _key(member):
+    return (member.name, getattr(member, 'args', None)) # overloads are distinct members
+
+class InheritanceGraph:
+    """
+        Inheritance of the compounds of a build, computed once in topological order (bases before derived compounds). The
+        ancestors and the member table (own and inherited members) of each compound are memoized from those of its direct bases,
+        so the total cost is linear in the size of the result rather than quadratic in the depth of the hierarchy. Bases that
+        are external (see Reference.EXTERNAL_ID) or were not parsed are leaves without members.
+
+        Member tables are only kept for compounds that are a base of another compound. Lazily parsed compounds (see objectify
+        lazy) are loaded to build their table, the table holds member definitions rather than the members themselves.
+
+        Args:
+            refs (iterable): references of the compounds of the build.
+    """
+
+    def __init__(self, refs):
+        nodes = {ref.id : ref for ref in refs if isinstance(ref.obj, Compound)}
+        self.bases = {id : tuple(ref.obj.inherit_from) for id, ref in nodes.items()}
+        self.order = self._sort(nodes)
+        self._ancestors = {}
+        self._members = {} # compound id -> {key : InheritedMember} of the members visible in the compound
+        needed = set(base.id for bases in self.bases.values() for base in bases)
+        for ref in self.order:
+            self._ancestors[ref.id] = self._merge_ancestors(ref)
+            if ref.id in needed:
+                self._members[ref.id] = self._merge_members(ref)
+
+    def _sort(self, nodes):
+        # Kahn's algorithm, iterative so that deep hierarchies do not hit the recursion limit
+        derived, remaining = {}, {}
+        for id, bases in self.bases.items():
+            bases = set(base.id for base in bases if base.id in nodes and base.id != id)
+            remaining[id] = len(bases)
+            for base in bases:
+                derived.setdefault(base, []).append(id)
+        queue = deque(id for id in nodes if remaining[id] == 0)
+        order = []
+        while len(queue) > 0:
+            id = queue.popleft()
+            order.append(nodes[id])
+            for child in derived.get(id, []):
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    queue.append(child)
+        if len(order) < len(nodes): # only possible with an inconsistent model
+            cyclic = [id for id in nodes if remaining[id] > 0]
+            Log.warn(f"Inheritance cycle between {sorted(cyclic)}, their inherited members may be incomplete.")
+            order.extend(nodes[id] for id in cyclic)
+        return order
+
+    def _merge_ancestors(self, ref):
+        ancestors, seen = [], set([ref.id])
+        for base in self.bases[ref.id]:
+            for x in (base, *self._ancestors.get(base.id, ())):
+                if x.id not in seen:
+                    seen.add(x.id)
+                    ancestors.append(x)
+        return tuple(ancestors)
+
+    def _inherited_table(self, ref):
+        table = {}
+        for base in self.bases.get(ref.id, ()): # earlier bases take precedence
+            for key, member in self._members.get(base.id, {}).items():
+                table.setdefault(key, member)
+        return table
+
+    def _merge_members(self, ref):
+        table = self._inherited_table(ref)
+        with loaded(ref) as obj:
+            for member in obj.members:
+                table[_key(member)] = InheritedMember(ref, member.name, member.kind, member.definition)
+        return table
+
+    def ancestors(self, ref):
+        """
+            All bases of ref, direct bases first, each once.
+        """
+        return self._ancestors.get(ref.id, ())
+
+    def inherited(self, ref):
+        """
+            Members of the ancestors of ref that ref does not override, ref must be loaded.
+
+            Returns:
+                list: (ancestor reference, [InheritedMember]) in the order of ancestors.
+        """
+        own = set(_key(member) for member in ref.obj.members)
+        grouped = {}
+        for key, member in self._inherited_table(ref).items():
+            if key not in own:
+                grouped.setdefault(member.owner.id, []).append(member)
+        return [(x, grouped[x.id]) for x in self.ancestors(ref) if x.id in grouped]
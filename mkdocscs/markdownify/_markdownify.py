@@ -6,90 +6,344 @@
 __author__ = "Benedict Wilkins"
 __email__ = "benrjw@gmail.com"
 __status__ = "Development"
+import os
+import time
 import pathlib
 import glob
+import multiprocessing
+import concurrent.futures
 from pprint import pprint
 import itertools
+import functools
 
-from ._generate import Markdownify
+from ._generate import Markdownify, write_page, keep_page
+from ._names import NameTable
+from ._symbols import write_symbol_index, symbol_entries
+from ._navigation import Navigation, Page, Section, Directory
+from ._output import OutputManifest
+from ._inheritance import InheritanceGraph
 
-from .._objectify import Namespace, Reference, Documentation 
+from .._objectify import Namespace, Reference, Documentation, COMPOUND_KINDS, loaded
+from ..utils import _profile as profile
 
 def page_namespace(markdownify : Markdownify, namespace : Namespace):
     markdownify.title(1,f"Namespace {markdownify.markdownify_name(namespace.obj)}")
     markdownify.write(markdownify.markdownify(namespace.obj.docstring))
     if len(namespace.obj.namespaces) > 0:
         markdownify.title(3,"Namespaces")
-        markdownify.list(sorted(namespace.obj.namespaces, key=lambda x: x.obj.name))
+        markdownify.list(sorted(namespace.obj.namespaces, key=markdownify.sort_key))
     if len(namespace.obj.classes) > 0:
         markdownify.title(3,"Classes")
-        markdownify.list(sorted(namespace.obj.classes, key=lambda x: x.obj.name))
+        markdownify.list(sorted(namespace.obj.classes, key=markdownify.sort_key))
+    for cls in markdownify.grouped(namespace):
+        markdownify.hline()
+        markdownify.anchor(cls.id)
+        with loaded(cls):
+            page_class(markdownify, cls, level=2)
 
-def page_class(markdownify : Markdownify, cls : Reference):
-    markdownify.title(1, f"{cls.obj.kind.capitalize()} {markdownify.markdownify_name(cls.obj)}") 
+def page_class(markdownify : Markdownify, cls : Reference, level=1):
+    markdownify.title(level, f"{cls.obj.kind.capitalize()} {markdownify.markdownify_name(cls.obj)}") 
     
     markdownify.newline()
     markdownify.write(markdownify.markdownify(cls.obj.docstring))
     markdownify.newline()
     markdownify.hline()
 
-    for key, group in itertools.groupby(cls.obj.members, key=lambda x: x.kind):
-        markdownify.title(4, key.capitalize())
-        markdownify.list(list(group))
+    subpages = markdownify.subpages(cls)
+    if subpages is None:
+        for key, group in itertools.groupby(cls.obj.members, key=lambda x: x.kind):
+            markdownify.title(level + 3, key.capitalize())
+            markdownify.list(list(group))
+            markdownify.hline()
+    else: # members are listed on a subpage per kind (see page_members)
+        markdownify.title(level + 3, "Members")
+        markdownify.list([markdownify.link_target(markdownify.subpage(cls, kind), f"{kind.capitalize()} ({count})") 
+                          for kind, count in subpages.items()])
         markdownify.hline()
 
+    inheritance = markdownify.inheritance()
     if len(cls.obj.inherit_from) > 0:
-        markdownify.title(4, "Inherits")
-        markdownify.list(cls.obj.inherit_from)
+        markdownify.title(level + 3, "Inherits")
+        markdownify.list(cls.obj.inherit_from if inheritance is None else inheritance.ancestors(cls))
 
     if len(cls.obj.inherit_by) > 0:
-        markdownify.title(4, "Derived")
+        markdownify.title(level + 3, "Derived")
         markdownify.list(cls.obj.inherit_by)
 
-    markdownify.title(4, f"Namespace: {markdownify.markdownify(cls.obj.namespace)}")    
+    inherited = inheritance.inherited(cls) if inheritance is not None else []
+    if len(inherited) > 0:
+        markdownify.title(level + 3, "Inherited members")
+        for owner, members in inherited:
+            markdownify.title(level + 4, f"From {markdownify.markdownify(owner)}")
+            markdownify.list(members)
+
+    markdownify.title(level + 3, f"Namespace: {markdownify.markdownify(cls.obj.namespace)}")    
     markdownify.write(f"Source: {cls.obj.path}\n")
 
-def markdownify(data, root_path="./docs", path="./docs", **kwargs):
-    Markdownify.set_base_path(path)
-    Markdownify.set_root_path(root_path)
-
-    print("-----------------------------------")
-    index = data['index']
-    # MARKDOWNIFY NAMESPACES
-    namespaces = index.__dict__['namespace']
-    with Markdownify(f"Namespace/index.md") as m:
-        m.title(1, "Namespaces")
-        m.list(namespaces) # TODO could nest them...
+def page_members(markdownify : Markdownify, cls : Reference, kind : str):
+    markdownify.title(1, f"{cls.obj.kind.capitalize()} {markdownify.markdownify_name(cls.obj)}: {kind.capitalize()}")
+    markdownify.newline()
+    markdownify.list([member for member in cls.obj.members if member.kind == kind])
+    markdownify.hline()
+
+def page_index(directory, title, refs, names, limit=0):
+    """ 
+        Write the index page of a directory listing refs. If there are more than limit refs, they are listed on alphabetical 
+        shard pages of at most limit refs (see index_shards) that the index page links to.
+    """
+    if limit <= 0 or len(refs) <= limit:
+        with Markdownify(f"{directory}/index.md") as m:
+            m.title(1, title)
+            m.list(refs)
+        return
+    shards = index_shards(refs, names, limit)
+    with Markdownify(f"{directory}/index.md") as m:
+        m.title(1, title)
+        m.list([m.link_target(f"{directory}/{file}/", label) + f" ({len(shard)})" for file, label, shard in shards])
+    navigation = Section("Index", [Page(label, f"{file}.md") for file, label, _ in shards])
+    for i, (file, label, shard) in enumerate(shards):
+        with Markdownify(f"{directory}/{file}.md", navigation=navigation if i == 0 else False) as m:
+            m.title(1, f"{title}: {label}")
+            m.list(shard)
+
+def index_shards(refs, names, limit):
+    """ 
+        Split refs by the first letter of their short name, letters with more than limit refs are split into numbered shards.
+
+        Returns:
+            list: (file name, label, refs) of each shard, sorted by letter.
+    """
+    letters = {}
+    for ref in refs:
+        letter = names.name(ref).short[:1].upper()
+        letters.setdefault(letter if letter.isalnum() else "_", []).append(ref)
+    shards = []
+    for letter in sorted(letters):
+        group = sorted(letters[letter], key=lambda x: (names.name(x).short, names.sort_key(x)))
+        chunks = [group[i:i + limit] for i in range(0, len(group), limit)]
+        for i, chunk in enumerate(chunks):
+            if len(chunks) == 1:
+                shards.append((f"index_{letter}", letter, chunk))
+            else:
+                shards.append((f"index_{letter}_{i + 1}", f"{letter} ({i + 1})", chunk))
+    return shards
+
+def class_jobs(directory, cls, names):
+    """ 
+        Render jobs (see render_pages) of the page of a compound and of its member subpages (see NameTable.split).
+    """
+    subpages = names.subpages.get(cls.id, None)
+    if subpages is None:
+        return [(f"{directory}/{cls.id}.md", True, cls.obj.name, page_class, cls)]
+    navigation = Section(cls.obj.name, [Page("Overview", f"{cls.id}.md"), 
+                                        *(Page(kind.capitalize(), f"{cls.id}/{kind}.md") for kind in subpages)])
+    return [(f"{directory}/{cls.id}.md", navigation, cls.obj.name, page_class, cls),
+            *((f"{directory}/{cls.id}/{kind}.md", False, None, functools.partial(page_members, kind=kind), cls) for kind in subpages)]
+
+def _member_kinds(cls):
+    with loaded(cls) as obj:
+        kinds = {}
+        for member in obj.members:
+            kinds[member.kind] = kinds.get(member.kind, 0) + 1
+        return kinds
+
+def _render_worker(job):
+    path, page, id, collect = job
+    start = time.perf_counter()
+    context = Markdownify.current_context()
+    context.write = False
+    ref = context.snapshot[id]
+    collected = None
+    with Markdownify(path, navigation=False) as m, loaded(ref):
+        page(m, ref)
+        if collect and context.collect is not None:
+            collected = context.collect(ref)
+    return m.text, m.dependencies, collected, start, time.perf_counter() - start, os.getpid()
+
+def render_pages(jobs, workers=None, pages=None, dependencies=None, collect=None):
+    """ 
+        Render pages, each job is (path, navigation, navigation title, page function, reference), navigation is a bool or a 
+        navigation entry (see Markdownify). A reference may have several pages (e.g. member subpages). If workers > 1 pages are rendered 
+        in forked worker processes that share a read-only snapshot of the model, navigation is recorded and pages are written by this 
+        process in job order so that the output is identical to a serial render.
+
+        Args:
+            jobs (list): pages to render.
+            workers (int, optional): number of worker processes. Defaults to None (render in this process).
+            pages (set, optional): ids of the references whose pages are rendered, the navigation of the other pages is still 
+                recorded. Defaults to None (all pages).
+            dependencies (dict, optional): updated with the ids of the references rendered in the pages of each reference, by id.
+            collect (callable, optional): called with each rendered reference while it is loaded (see objectify lazy), 
+                the results must be picklable. Defaults to None.
+
+        Returns:
+            dict: results of collect by reference id.
+    """
+    targets = [Markdownify(path, navigation_title=title, navigation=navigation) for path, navigation, title, _, _ in jobs]
+    for m, job in zip(targets, jobs):
+        if pages is not None and job[-1].id not in pages:
+            keep_page(m.path)
+    jobs = [(m, job) for m, job in zip(targets, jobs) if pages is None or job[-1].id in pages]
+    rendered = {} # dependencies of the pages of each reference
+    collected = {}
+    collects, seen = [], set() # collect once per reference, on its first page
+    for _, job in jobs:
+        collects.append(collect is not None and job[-1].id not in seen)
+        seen.add(job[-1].id)
+    if workers is None or workers <= 1 or len(jobs) <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+        for (m, (path, _, _, page, ref)), collecting in zip(jobs, collects):
+            start = time.perf_counter()
+            with m, loaded(ref): # lazily parsed objects are loaded only while their page is rendered
+                page(m, ref)
+                if collecting:
+                    collected[ref.id] = collect(ref)
+            rendered.setdefault(ref.id, set()).update(m.dependencies)
+            profile.item("render", path, time.perf_counter() - start, start=start)
+    else:
+        context = Markdownify.current_context() # the workers of each build get its own context, whichever thread forks them
+        context.snapshot = {ref.id : ref for _, (*_, ref) in jobs}
+        context.collect = collect
+        try:
+            chunksize = max(1, len(jobs) // (workers * 4))
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork"), 
+                                                        initializer=Markdownify.set_context, initargs=(context,)) as pool:
+                results = pool.map(_render_worker, [(path, page, ref.id, collecting) for (_, (path, _, _, page, ref)), collecting 
+                                                    in zip(jobs, collects)], chunksize=chunksize)
+                for (m, job), collecting, (text, depends, result, start, seconds, pid) in zip(jobs, collects, results):
+                    write_page(m.path, text)
+                    rendered.setdefault(job[-1].id, set()).update(depends)
+                    if collecting:
+                        collected[job[-1].id] = result
+                    profile.item("render", job[0], seconds, start=start, pid=pid)
+        finally:
+            context.snapshot = {}
+            context.collect = None
+    if dependencies is not None:
+        dependencies.update(rendered)
+    return collected
+
+def namespace_navigation(namespaces, names):
+    """ 
+        Navigation entries for namespace pages, nested namespaces are grouped in a section with their parent.
+    """
+    ids = set(n.id for n in namespaces)
+    children = {}
     for namespace in namespaces:
-        with Markdownify(f"Namespace/{namespace.id}.md", navigation_title=namespace.obj.name) as m:
-            page_namespace(m, namespace)
-
-    # MARKDOWNIFY CLASSES
-    classes = index.__dict__.get('class', [])
-    with Markdownify("Class/index.md") as m:
-        m.title(1, "Classes")
-        m.list(classes)
-    for cls in sorted(classes, key = lambda x: x.obj.name):
-        with Markdownify(f"Class/{cls.id}.md", navigation_title=cls.obj.name) as m:
-            page_class(m, cls)
-
-    classes = index.__dict__.get('interface', [])
-    with Markdownify("Interface/index.md") as m:
-        m.title(1, "Interfaces")
-        m.list(classes)
+        parent = namespace.obj.parent
+        children.setdefault(parent.id if parent is not None and parent.id in ids else None, []).append(namespace)
+    def _entries(parent, title):
+        for namespace in sorted(children.get(parent, []), key=names.sort_key):
+            page = Page(title(namespace), f"{namespace.id}.md")
+            if namespace.obj.parent is None: # global namespace, its children are listed alongside it
+                yield page
+                yield from _entries(namespace.id, title)
+            elif namespace.id in children:
+                yield Section(page.title, [page, *_entries(namespace.id, lambda x: names.name(x).short)])
+            else:
+                yield page
+    return list(_entries(None, lambda x: x.obj.name))
+
+@profile.profiled("markdownify")
+def markdownify(data, root_path="./docs", path="./docs", symbol_index="symbols.json", workers=None, manifest=".mkdocscs.json", group_threshold=0, split_threshold=0, index_limit=0, inheritance=False, pages=None, dependencies=None, output=None, sync=False, **kwargs):
+    """ 
+        Write markdown pages for the objects produced by objectify.
+
+        Args:
+            data (dict): parsed objects, see objectify.
+            root_path (str, optional): project root, used to compute relative links. Defaults to "./docs".
+            path (str, optional): output directory. Defaults to "./docs".
+            symbol_index (str, optional): file name (in path) of a json index of every rendered symbol (name, kind, namespace, 
+                url, brief description), sorted by name. Defaults to "symbols.json", None to disable.
+            workers (int, optional): number of worker processes used to render pages. Defaults to None (render in this process).
+            manifest (str, optional): file name (in path) of the output manifest, files whose content is unchanged since the 
+                last build are not rewritten. Defaults to ".mkdocscs.json", None to always write every file.
+            group_threshold (int, optional): classes and interfaces with fewer members than this are rendered as anchored sections
+                of their namespace page instead of standalone pages. Defaults to 0 (every compound has its own page).
+            split_threshold (int, optional): classes and interfaces with more members than this list their members on a subpage
+                per member kind. Defaults to 0 (members are listed on the compound page).
+            index_limit (int, optional): index pages with more entries than this are split into alphabetical shards of at most
+                index_limit entries. Defaults to 0 (a single index page).
+            inheritance (bool, optional): list all bases of each class and interface (not only the direct bases) and the members 
+                it inherits from them (see InheritanceGraph). Defaults to False.
+            pages (set, optional): ids of the namespaces and compounds whose pages are rendered, index pages, navigation and the 
+                symbol index are always written. Defaults to None (all pages).
+            dependencies (dict, optional): updated with the ids of the references that each rendered page depends on, by page id.
+            output (OutputManifest, optional): receives the generated files instead of the manifest, e.g. a MemoryOutput to keep 
+                them in memory. Defaults to None.
+            sync (bool, optional): delete files produced by a previous build (see manifest) that are no longer generated. 
+                Defaults to False.
+    """
+    with Markdownify.new_context(): # builds do not share paths, names, navigation or output
+        Markdownify.set_base_path(path)
+        Markdownify.set_root_path(root_path)
+        names = NameTable(ref for kind in ['namespace', *sorted(COMPOUND_KINDS)] for ref in data['index'].__dict__.get(kind, []))
+        Markdownify.set_names(names)
+        navigation = Navigation(kwargs.get('navigation_file', '.pages'))
+        Markdownify.set_navigation(navigation)
+        if output is None:
+            pathlib.Path(path).mkdir(parents=True, exist_ok=True)
+            output = OutputManifest(path, manifest_file=manifest) if manifest is not None else None
+        Markdownify.set_output(output)
+
+        print("-----------------------------------")
+        index = data['index']
+        namespaces = index.__dict__['namespace']
     
-    for cls in sorted(classes, key = lambda x: x.obj.name):
-        #print(cls.obj.name)
-        with Markdownify(f"Interface/{cls.id}.md", navigation_title=cls.obj.name) as m:
-            page_class(m, cls)
-
-    # order navigation...
-    pages_path = pathlib.Path(path, kwargs.get('navigation_file', '.pages'))
-    with pages_path.open("a") as pages:
-        pages.write("nav: \n")
-        pages.write("    - Namespace\n")
-        pages.write("    - Class\n")
-        pages.write("    - Interface\n")
+        # GROUP SMALL COMPOUNDS INTO THEIR NAMESPACE PAGE, SPLIT LARGE COMPOUNDS INTO SUBPAGES
+        namespace_ids = set(n.id for n in namespaces)
+        standalone = {}
+        for kind in ['class', 'interface']:
+            standalone[kind] = []
+            for cls in sorted(index.__dict__.get(kind, []), key=names.sort_key):
+                namespace = cls.obj.namespace
+                kinds = _member_kinds(cls) if group_threshold > 0 or split_threshold > 0 else None
+                size = sum(kinds.values()) if kinds is not None else 0
+                if group_threshold > 0 and namespace is not None and namespace.id in namespace_ids and size < group_threshold:
+                    names.group(cls, namespace)
+                else:
+                    if split_threshold > 0 and size > split_threshold:
+                        names.split(cls, kinds)
+                    standalone[kind].append(cls)
+
+        with profile.phase("inheritance"):
+            compounds = [ref for kind in sorted(COMPOUND_KINDS) for ref in index.__dict__.get(kind, [])]
+            Markdownify.set_inheritance(InheritanceGraph(compounds) if inheritance else None)
+
+        # MARKDOWNIFY NAMESPACES
+        page_index("Namespace", "Namespaces", namespaces, names, limit=index_limit) # TODO could nest them...
+        jobs = [(f"Namespace/{namespace.id}.md", False, None, page_namespace, namespace) for namespace in namespaces]
+        navigation.extend(pathlib.Path(path, "Namespace").resolve(), namespace_navigation(namespaces, names))
+
+        # MARKDOWNIFY CLASSES
+        page_index("Class", "Classes", index.__dict__.get('class', []), names, limit=index_limit)
+        jobs.extend(job for cls in standalone['class'] for job in class_jobs("Class", cls, names))
+
+        page_index("Interface", "Interfaces", index.__dict__.get('interface', []), names, limit=index_limit)
+        jobs.extend(job for cls in standalone['interface'] for job in class_jobs("Interface", cls, names))
+        try:
+            url_prefix = pathlib.Path(path).resolve().relative_to(pathlib.Path(root_path).resolve()).as_posix() + "/"
+        except ValueError:
+            url_prefix = ""
+        url_prefix = "" if url_prefix == "./" else url_prefix
+        # symbol index entries are collected while each page is loaded, lazily parsed objects need not be loaded again
+        collect = functools.partial(symbol_entries, names=names, url_prefix=url_prefix) if symbol_index is not None else None
+        with profile.phase("render"):
+            entries = render_pages(jobs, workers=workers, pages=pages, dependencies=dependencies, collect=collect)
+
+        with profile.phase("symbol_index"):
+            if symbol_index is not None:
+                refs = [*namespaces, *index.__dict__.get('class', []), *index.__dict__.get('interface', [])]
+                write_symbol_index(pathlib.Path(path, symbol_index), refs, names, url_prefix=url_prefix, output=output, entries=entries)
+
+        # order navigation...
+        with profile.phase("navigation"):
+            navigation.extend(pathlib.Path(path).resolve(), [Directory("Namespace"), Directory("Class"), Directory("Interface")])
+            navigation.write(output=output)
+        if output is not None:
+            with profile.phase("output"):
+                if sync and hasattr(output, 'remove_stale'):
+                    output.remove_stale()
+                output.save()
         
 
 
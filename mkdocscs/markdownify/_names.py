@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+   Created on 18-10-2026
+"""
+__author__ = "Benedict Wilkins"
+__email__ = "benrjw@gmail.com"
+__status__ = "Development"
+
+from collections import namedtuple
+
+from .._objectify import External, GLOBAL_ID
+
+Name = namedtuple("Name", ["qualified", "short", "sort_key", "target", "parents"])
+
+class NameTable:
+    """
+        Per-build table of names and link targets for each Reference, computed once per reference. Linked names are cached per
+        relative path (i.e. per output depth) so that repeated mentions of a reference cost a dict lookup.
+    """
+
+    def __init__(self, refs=()):
+        self.names = {}
+        self.links = {}
+        self.groups = {} # namespace id -> references rendered as sections of the namespace page
+        self.subpages = {} # compound id -> {member kind : count} of members rendered on subpages of the compound page
+        for ref in refs:
+            self.name(ref)
+
+    def name(self, ref):
+        name = self.names.get(ref.id, None)
+        if name is None:
+            obj = ref.obj
+            parents = tuple(reversed([x for x in obj.get_parents() if x.id != GLOBAL_ID])) if hasattr(obj, 'get_parents') else ()
+            name = self.names[ref.id] = Name(obj.name, obj.name.split("::")[-1], obj.name, f"{obj.kind.capitalize()}/{ref.id}/", parents)
+        return name
+
+    def group(self, ref, namespace):
+        """
+            Render ref as a section of its namespace page, links to ref target an anchor in that page. 
+            Must be called before any links to ref are created.
+        """
+        self.names[ref.id] = self.name(ref)._replace(target=f"{self.name(namespace).target}#{ref.id}")
+        self.groups.setdefault(namespace.id, []).append(ref)
+
+    def split(self, ref, kinds):
+        """
+            Render the members of ref on a subpage per member kind (see subpage) instead of on its page.
+        """
+        self.subpages[ref.id] = kinds
+
+    def subpage(self, ref, kind):
+        """
+            Link target of the subpage of ref listing its members of the given kind.
+        """
+        return f"{self.name(ref).target}{kind}/"
+
+    def sort_key(self, ref):
+        return self.name(ref).sort_key
+
+    def link(self, ref, relative_path, text=None):
+        if text is not None:
+            return f"[{text}]({relative_path}{self.name(ref).target})"
+        key = (ref.id, relative_path, True)
+        link = self.links.get(key, None)
+        if link is None:
+            name = self.name(ref)
+            link = self.links[key] = f"[{name.short}]({relative_path}{name.target})"
+        return link
+
+    def linked_name(self, ref, relative_path):
+        """
+            The qualified name of ref with each part linked to its page, external parts (e.g. namespaces that were not selected) 
+            are plain text.
+        """
+        key = (ref.id, relative_path, False)
+        link = self.links.get(key, None)
+        if link is None:
+            names = [*self.name(ref).parents, ref]
+            link = self.links[key] = "::".join(n.obj.name if isinstance(n.obj, External) else self.link(n, relative_path) for n in names)
+        return link
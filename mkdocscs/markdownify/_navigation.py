@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+   Created on 18-10-2026
+"""
+__author__ = "Benedict Wilkins"
+__email__ = "benrjw@gmail.com"
+__status__ = "Development"
+
+import pathlib
+from collections import namedtuple
+
+from ..utils import _profile as profile
+
+Page = namedtuple("Page", ["title", "file"])
+Section = namedtuple("Section", ["title", "entries"])
+Directory = namedtuple("Directory", ["name"])
+
+def _quote(x):
+    return "'" + str(x).replace("'", "''") + "'"
+
+class Navigation:
+    """
+        Navigation (awesome-pages .pages files) built in memory while rendering and written once per directory at the end.
+        Entries are Page, Section (nested entries) or Directory.
+    """
+
+    def __init__(self, navigation_file=".pages"):
+        self.navigation_file = navigation_file
+        self.directories = {}
+
+    def add(self, path, title=None):
+        """
+            Add a page to the navigation of the directory that contains it.
+        """
+        path = pathlib.Path(path)
+        self.directories.setdefault(path.parent, []).append(Page(title, path.name))
+
+    def extend(self, directory, entries):
+        self.directories.setdefault(pathlib.Path(directory), []).extend(entries)
+
+    def render(self, entries, indent=1):
+        lines = []
+        for entry in entries:
+            prefix = '    ' * indent + '- '
+            if isinstance(entry, Section):
+                lines.append(f"{prefix}{_quote(entry.title)}:")
+                lines.extend(self.render(entry.entries, indent=indent + 1))
+            elif isinstance(entry, Directory):
+                lines.append(f"{prefix}{entry.name}")
+            elif entry.title is None:
+                lines.append(f"{prefix}{_quote(entry.file)}")
+            else:
+                lines.append(f"{prefix}{_quote(entry.title)} : {_quote(entry.file)}")
+        return lines
+
+    def write(self, output=None):
+        """
+            Write the navigation file of each directory, through output (see OutputManifest) if given.
+        """
+        for directory in sorted(self.directories):
+            path = pathlib.Path(directory, self.navigation_file)
+            text = "\n".join(["nav:", *self.render(self.directories[directory])]) + "\n"
+            if output is not None:
+                output.write(path, text)
+            else:
+                directory.mkdir(parents=True, exist_ok=True)
+                with path.open('w') as f:
+                    f.write(text)
+                profile.written(text)
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+   Created on 18-10-2026
+"""
+__author__ = "Benedict Wilkins"
+__email__ = "benrjw@gmail.com"
+__status__ = "Development"
+
+import json
+import hashlib
+import pathlib
+
+from ..utils import Log
+from ..utils import _profile as profile
+
+MANIFEST_VERSION = 1
+
+def _hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+class OutputManifest:
+    """
+        Writes output files only if their content changed, so that unchanged pages keep their mtime (and are not rebuilt by
+        mkdocs or redeployed). The hash, size and mtime of each written file are kept in a manifest in the output directory,
+        a file whose size and mtime match its manifest entry is compared by hash, otherwise by its content. Entries of files that
+        were not produced by a build are kept until remove_stale deletes them, so that a later build with sync still removes
+        them.
+
+        Args:
+            path (str): output directory.
+            manifest_file (str, optional): name of the manifest file in path. Defaults to ".mkdocscs.json".
+    """
+
+    def __init__(self, path, manifest_file=".mkdocscs.json"):
+        self.path = pathlib.Path(path).resolve()
+        self.manifest_path = pathlib.Path(self.path, manifest_file)
+        self.files = {}
+        self.written = set() # files written (or left unchanged) by this build
+        self.directories = set()
+        self.changed = 0
+        try:
+            with self.manifest_path.open('r') as f:
+                manifest = json.load(f)
+            if manifest.get('version', None) == MANIFEST_VERSION:
+                self.files = manifest['files']
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def _key(self, path):
+        return pathlib.Path(path).resolve().relative_to(self.path).as_posix()
+
+    def unchanged(self, path, key, digest):
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        entry = self.files.get(key, None)
+        if entry is not None and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime_ns:
+            return entry['hash'] == digest
+        with path.open('rb') as f:
+            return _hash(f.read()) == digest
+
+    def write(self, path, text):
+        """
+            Write text to path unless the file already has this content. Returns True if the file was written.
+        """
+        path = pathlib.Path(path)
+        key = self._key(path)
+        data = text.encode("utf-8")
+        digest = _hash(data)
+        self.written.add(key)
+        changed = not self.unchanged(path, key, digest)
+        if changed:
+            if path.parent not in self.directories:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                self.directories.add(path.parent)
+            with path.open('wb') as f:
+                f.write(data)
+            profile.written(data)
+            self.changed += 1
+        stat = path.stat()
+        self.files[key] = dict(hash=digest, size=stat.st_size, mtime=stat.st_mtime_ns)
+        return changed
+
+    def keep(self, path):
+        """
+            Keep a file of the build that was not rendered again (see markdownify pages).
+        """
+        self.written.add(self._key(path))
+
+    def remove_stale(self):
+        """
+            Delete files of previous builds (recorded in the manifest) that were not produced by this build, along with directories 
+            that are left empty. Other files in the output directory are never touched.
+        """
+        stale = sorted(set(self.files) - self.written)
+        directories = set()
+        for key in stale:
+            path = pathlib.Path(self.path, key)
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            directories.update(p for p in path.parents if self.path in p.parents)
+            del self.files[key]
+        for directory in sorted(directories, key=lambda x: len(x.parts), reverse=True):
+            try:
+                directory.rmdir() # only if empty
+            except OSError:
+                pass
+        if len(stale) > 0:
+            Log.log(f"Output: removed {len(stale)} stale files")
+        return stale
+
+    def save(self):
+        with self.manifest_path.open('w') as f:
+            json.dump(dict(version=MANIFEST_VERSION, files=self.files), f, indent=1, sort_keys=True)
+        Log.log(f"Output: {self.changed} of {len(self.written)} files changed")
+
+class MemoryOutput:
+    """
+        Keeps generated files in memory instead of writing them, with the interface of OutputManifest. After save, files holds 
+        the text of each file of the last build by path relative to the output directory. Files that were kept (not rendered 
+        again) retain their text from the previous build.
+
+        Args:
+            path (str): output directory.
+    """
+
+    def __init__(self, path):
+        self.path = pathlib.Path(path).resolve()
+        self.files = {}
+        self.written = set()
+
+    def _key(self, path):
+        return pathlib.Path(path).resolve().relative_to(self.path).as_posix()
+
+    def write(self, path, text):
+        key = self._key(path)
+        changed = self.files.get(key, None) != text
+        self.files[key] = text
+        self.written.add(key)
+        return changed
+
+    def keep(self, path):
+        self.written.add(self._key(path))
+
+    def save(self):
+        self.files = {k:v for k,v in self.files.items() if k in self.written}
+        self.written = set()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+   Created on 18-10-2026
+"""
+__author__ = "Benedict Wilkins"
+__email__ = "benrjw@gmail.com"
+__status__ = "Development"
+
+import html
+import json
+import pathlib
+
+from .._objectify import Reference, loaded
+from ..utils import _profile as profile
+
+SYMBOL_INDEX_VERSION = 1
+FIELDS = ["name", "kind", "namespace", "url", "brief"]
+
+def plain_text(doc):
+    """
+        Plain text of a documentation list, references are replaced by their short names.
+    """
+    def _text(x):
+        if isinstance(x, Reference):
+            return x.obj.name.split("::")[-1] if x.obj is not None else ""
+        return x
+    return html.unescape(" ".join("".join(_text(x) for x in doc).split()))
+
+def symbol_entries(ref, names, url_prefix=""):
+    """
+        Symbol index entries (see FIELDS) of a compound (or namespace) and each of its members, the object must be loaded (see 
+        objectify lazy).
+    """
+    obj, name = ref.obj, names.name(ref)
+    url = f"{url_prefix}{name.target}"
+    qualified = html.unescape(name.qualified) # names are escaped for markdown
+    namespace = getattr(obj, 'namespace', None) or getattr(obj, 'parent', None) # the parent of a namespace
+    namespace = names.name(namespace).qualified if namespace is not None else ""
+    result = [[qualified, obj.kind, namespace, url, plain_text(obj.docstring.long)]] # long holds the brief description
+    subpages = names.subpages.get(ref.id, None)
+    for member in getattr(obj, 'members', []):
+        member_url = f"{url_prefix}{names.subpage(ref, member.kind)}" if subpages is not None else url
+        result.append([f"{qualified}::{member.name}", member.kind, namespace, member_url, plain_text(member.docstring.long)])
+    return result
+
+def symbols(refs, names, url_prefix="", entries=None):
+    """
+        Symbol index entries (see FIELDS) for each compound in refs and each of its members.
+
+        Args:
+            refs (list): references of the compounds (and namespaces) that have pages.
+            names (NameTable): names of the build.
+            url_prefix (str, optional): url of the output directory relative to the site root.
+            entries (dict, optional): entries already collected (see symbol_entries) by reference id, e.g. while rendering.
+    """
+    entries = entries if entries is not None else {}
+    for ref in refs:
+        if ref.id in entries:
+            yield from entries[ref.id]
+        else:
+            with loaded(ref): # lazily parsed objects are loaded again
+                yield from symbol_entries(ref, names, url_prefix=url_prefix)
+
+def write_symbol_index(path, refs, names, url_prefix="", output=None, entries=None):
+    """
+        Write a compact json symbol index sorted by qualified name, for symbol search without full text indexing of pages.
+        The index is written through output (see OutputManifest) if given.
+    """
+    entries = sorted(symbols(refs, names, url_prefix=url_prefix, entries=entries), key=lambda x: (x[0], x[1], x[3]))
+    text = json.dumps(dict(version=SYMBOL_INDEX_VERSION, fields=FIELDS, symbols=entries), separators=(",", ":"))
+    if output is not None:
+        output.write(path, text)
+    else:
+        with pathlib.Path(path).open("w") as f:
+            f.write(text)
+        profile.written(text)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+   Created on 18-10-2026
+
+   mkdocs plugin, generates the documentation pages in-process and adds them to the site as virtual files.
+
+   plugins:
+     - mkdocscs:
+         xml: xml            # doxygen xml directory (or combined xml file), relative to mkdocs.yml
+         output: api         # directory of the generated pages in the site
+"""
+__author__ = "Benedict Wilkins"
+__email__ = "benrjw@gmail.com"
+__status__ = "Development"
+
+import pathlib
+
+from mkdocs.config import config_options
+from mkdocs.plugins import BasePlugin
+from mkdocs.structure.files import File
+
+from .utils import Log
+from ._cache import MemoryCache
+from ._objectify import objectify, SymbolTable
+from ._watch import affected
+from .markdownify import markdownify, MemoryOutput
+
+class MkdocsCSPlugin(BasePlugin):
+    """
+        Generates pages with objectify and markdownify on each build without writing them to docs_dir. The parsed model is kept
+        across rebuilds of `mkdocs serve`, only xml files that changed are parsed again and only the pages that depend on them are
+        rendered.
+    """
+
+    config_scheme = (
+        ('xml', config_options.Type(str, default='xml')),
+        ('output', config_options.Type(str, default='api')),
+        ('namespaces', config_options.Type(list, default=None)),
+        ('selective', config_options.Type(bool, default=False)),
+        ('backend', config_options.Choice(['etree', 'lxml'], default='etree')),
+        ('group_threshold', config_options.Type(int, default=0)),
+        ('split_threshold', config_options.Type(int, default=0)),
+        ('index_limit', config_options.Type(int, default=0)),
+        ('inheritance', config_options.Type(bool, default=False)),
+        ('jobs', config_options.Type(int, default=1)),
+    )
+
+    def __init__(self):
+        self.cache = MemoryCache()
+        self.dependencies = {}
+        self.output = None
+
+    def on_startup(self, *, command, dirty):
+        pass # defining on_startup keeps this instance (and the parsed model) alive across rebuilds of mkdocs serve
+
+    def _xml_path(self, config):
+        return pathlib.Path(pathlib.Path(config['config_file_path'] or ".").parent, self.config['xml']).resolve()
+
+    def on_files(self, files, config):
+        docs_dir = pathlib.Path(config['docs_dir']).resolve()
+        path = pathlib.Path(docs_dir, self.config['output'])
+        if self.output is None or self.output.path != path.resolve():
+            self.output, self.dependencies = MemoryOutput(path), {}
+
+        with SymbolTable() as symbols:
+            objects = objectify(str(self._xml_path(config)), cache=self.cache, symbols=symbols, workers=self.config['jobs'],
+                                backend=self.config['backend'], selective=self.config['selective'],
+                                namespaces=self.config['namespaces'])
+            changed = set(pathlib.Path(file).stem for file in self.cache.changed)
+            self.cache.changed.clear()
+            pages = affected(changed, self.dependencies) if len(self.output.files) > 0 else None
+            markdownify(objects, path=str(path), root_path=str(docs_dir), workers=self.config['jobs'],
+                        group_threshold=self.config['group_threshold'], split_threshold=self.config['split_threshold'],
+                        index_limit=self.config['index_limit'], inheritance=self.config['inheritance'], pages=pages, dependencies=self.dependencies,
+                        output=self.output)
+
+        for file, text in self.output.files.items():
+            uri = pathlib.PurePosixPath(self.config['output'], file).as_posix()
+            existing = files.get_file_from_path(uri)
+            if existing is not None:
+                Log.warn(f"Generated page {uri} replaces {existing.abs_src_path}")
+                files.remove(existing)
+            files.append(File.generated(config, uri, content=text))
+        return files
+
+    def on_serve(self, server, config, builder):
+        server.watch(str(self._xml_path(config)))
+        return server
@@ -8,5 +8,6 @@ __email__ = "benrjw@gmail.com"
 __status__ = "Development"
 
 from ._log import Log
+from ._profile import Profiler
 
-__all__ = ('Log',)
\ No newline at end of file
+__all__ = ('Log', 'Profiler')
\ No newline at end of file
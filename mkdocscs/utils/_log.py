@@ -28,12 +28,13 @@ class Log:
 
     def __new__(cls, *args, **kwargs):
         if Log._LOGGER is None:
-            _LOGGER = super().__new__(cls)
-            #_LOGGER.__init___(*args, **kwargs)
-        return _LOGGER
+            Log._LOGGER = super().__new__(cls)
+            Log._LOGGER.silent = False
+        return Log._LOGGER
 
-    def __init__(self, silent=False):
-        self.silent = silent
+    def __init__(self, silent=None):
+        if silent is not None:
+            self.silent = silent
     
     @_log
     def warn(self, message):
@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+   Created on 18-10-2026
+"""
+__author__ = "Benedict Wilkins"
+__email__ = "benrjw@gmail.com"
+__status__ = "Development"
+
+import os
+import json
+import time
+import heapq
+import threading
+import contextlib
+import tracemalloc
+
+from ._log import Log
+
+_PROFILER = None
+
+def _cpu():
+    t = os.times()
+    return t.user + t.system + t.children_user + t.children_system # includes worker processes that have exited
+
+class Phase:
+
+    __slots__ = ("name", "start", "wall", "cpu", "counts", "peak", "_cpu", "_peak")
+
+    def __init__(self, name, start):
+        self.name, self.start, self.wall, self.cpu = name, start, 0.0, 0.0
+        self.counts = dict(files_read=0, bytes_read=0, files_written=0, bytes_written=0)
+        self.peak, self._cpu, self._peak = None, _cpu(), 0
+
+    def to_dict(self):
+        return dict(name=self.name, start=self.start, wall=self.wall, cpu=self.cpu, **self.counts, memory_peak=self.peak)
+
+class Profiler:
+    """
+        Records the wall time, cpu time (including worker processes), files and bytes read and written and (optionally) the
+        tracemalloc peak of each phase of a build, along with the time taken by each item of a phase (files parsed, pages
+        rendered). Install with Profiler.start, phases are then recorded by the library (see phase, count and item).
+
+        Hooks are called with (event, data) where event is "phase_start", "phase_end" (data is the phase dict) or "item" (data is
+        a dict with category, name, start, seconds and the pid of the process that handled the item).
+
+        Args:
+            memory (bool, optional): record the tracemalloc peak of each phase, this slows down the build. Defaults to False.
+            top (int, optional): number of slowest items of each category to report. Defaults to 20.
+    """
+
+    def __init__(self, memory=False, top=20):
+        self.memory = memory
+        self.top = top
+        self.hooks = []
+        self.phases = []
+        self.items = {}
+        self._stack = []
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook):
+        self.hooks.append(hook)
+        return hook
+
+    def _call(self, event, data):
+        for hook in self.hooks:
+            hook(event, data)
+
+    def now(self):
+        return time.perf_counter() - self._origin
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        phase = Phase(name, self.now())
+        if self.memory and tracemalloc.is_tracing():
+            if len(self._stack) > 0:
+                self._stack[-1]._peak = max(self._stack[-1]._peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        self._stack.append(phase)
+        self._call("phase_start", phase.to_dict())
+        try:
+            yield phase
+        finally:
+            self._stack.pop()
+            phase.wall = self.now() - phase.start
+            phase.cpu = _cpu() - phase._cpu
+            if self.memory and tracemalloc.is_tracing():
+                phase.peak = max(phase._peak, tracemalloc.get_traced_memory()[1])
+                if len(self._stack) > 0:
+                    self._stack[-1]._peak = max(self._stack[-1]._peak, phase.peak)
+            self.phases.append(phase)
+            self._call("phase_end", phase.to_dict())
+
+    def count(self, **counts):
+        for phase in self._stack: # counts are inclusive of nested phases
+            for k, v in counts.items():
+                phase.counts[k] += v
+
+    def item(self, category, name, seconds, start=None, pid=None):
+        """
+            Record an item of a phase. start is the time.perf_counter() at which it started, which is comparable across 
+            processes, taken in the process that handled the item (pid, e.g. a worker). Defaults to seconds ago in this process.
+        """
+        start = self.now() - seconds if start is None else start - self._origin
+        item = dict(category=category, name=str(name), start=start, seconds=seconds, pid=pid if pid is not None else os.getpid())
+        with self._lock:
+            self.items.setdefault(category, []).append(item)
+        self._call("item", item)
+
+    def slowest(self, category):
+        return heapq.nlargest(self.top, self.items.get(category, []), key=lambda x: x['seconds'])
+
+    def report(self):
+        phases = sorted(self.phases, key=lambda x: x.start)
+        return dict(phases=[p.to_dict() for p in phases], slowest={k : self.slowest(k) for k in sorted(self.items)},
+                    items={k : len(v) for k, v in self.items.items()})
+
+    def write(self, path):
+        """
+            Write the report as json.
+        """
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=1)
+
+    def write_trace(self, path):
+        """
+            Write phases and items as a Chrome trace-event file (chrome://tracing, Perfetto). The items of each category are on a 
+            thread per process that handled them, so that items of parallel workers do not overlap.
+        """
+        pid = os.getpid()
+        events = [dict(name=p.name, cat="phase", ph="X", ts=p.start * 1e6, dur=p.wall * 1e6, pid=pid, tid=0,
+                       args=dict(cpu=p.cpu, **p.counts, memory_peak=p.peak)) for p in self.phases]
+        threads = {}
+        for category, items in sorted(self.items.items()):
+            for x in items:
+                key = (category, x['pid'])
+                if key not in threads:
+                    threads[key] = len(threads) + 1
+                    name = category if x['pid'] == pid else f"{category} (worker {x['pid']})"
+                    events.append(dict(name="thread_name", ph="M", pid=pid, tid=threads[key], args=dict(name=name)))
+                events.append(dict(name=x['name'], cat=category, ph="X", ts=x['start'] * 1e6, dur=x['seconds'] * 1e6, pid=pid,
+                                   tid=threads[key]))
+        events.append(dict(name="thread_name", ph="M", pid=pid, tid=0, args=dict(name="phases")))
+        with open(path, "w") as f:
+            json.dump(dict(traceEvents=events, displayTimeUnit="ms"), f)
+
+    def summary(self):
+        """
+            Log the time of each phase and the slowest items.
+        """
+        for p in sorted(self.phases, key=lambda x: x.start):
+            memory = f", peak {p.peak / (1 << 20):.1f} MB" if p.peak is not None else ""
+            Log.log(f"{p.name:<16} wall {p.wall:8.3f}s cpu {p.cpu:8.3f}s read {p.counts['files_read']} files "
+                    f"({p.counts['bytes_read'] / (1 << 20):.1f} MB) wrote {p.counts['files_written']} files "
+                    f"({p.counts['bytes_written'] / (1 << 20):.1f} MB){memory}")
+        for category in sorted(self.items):
+            slowest = ", ".join(f"{x['name']} ({x['seconds'] * 1000:.1f}ms)" for x in self.slowest(category)[:5])
+            Log.log(f"slowest {category}: {slowest}")
+
+    @classmethod
+    def start(cls, *args, **kwargs):
+        """
+            Create a profiler and install it, returns the profiler.
+        """
+        global _PROFILER
+        _PROFILER = cls(*args, **kwargs)
+        if _PROFILER.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        return _PROFILER
+
+    @classmethod
+    def stop(cls):
+        global _PROFILER
+        profiler, _PROFILER = _PROFILER, None
+        if profiler is not None and profiler.memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        return profiler
+
+    @classmethod
+    def current(cls):
+        return _PROFILER
+
+def phase(name):
+    """
+        Context manager recording a phase with the installed profiler, does nothing if there is none.
+    """
+    return _PROFILER.phase(name) if _PROFILER is not None else contextlib.nullcontext()
+
+def profiled(name):
+    """
+        Decorator recording each call of a function as a phase.
+    """
+    def decorator(fun):
+        def _profiled(*args, **kwargs):
+            with phase(name):
+                return fun(*args, **kwargs)
+        _profiled.__name__, _profiled.__doc__ = fun.__name__, fun.__doc__
+        return _profiled
+    return decorator
+
+def count(**counts):
+    if _PROFILER is not None:
+        _PROFILER.count(**counts)
+
+def written(data):
+    """
+        Count a file written with the installed profiler, data is the text or bytes written.
+    """
+    if _PROFILER is not None:
+        _PROFILER.count(files_written=1, bytes_written=len(data.encode("utf-8") if isinstance(data, str) else data))
+
+def item(category, name, seconds, start=None, pid=None):
+    if _PROFILER is not None:
+        _PROFILER.item(category, name, seconds, start=start, pid=pid)
+
+def profiling():
+    return _PROFILER is not None
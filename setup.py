@@ -17,6 +17,10 @@ setup(name='mkdocscs',
       url='',
       author='Benedict Wilkins',
       author_email='benrjw@gmail.com',
-      packages=find_packages(),
+      packages=find_packages(exclude=['benchmarks']),
+      python_requires='>=3.10',
       install_requires=['mkdocs-awesome-pages-plugin', 'mkdocs-autolinks-plugin', 'mkdocs-section-index'],
+      extras_require={'lxml': ['lxml'], 'mkdocs': ['mkdocs>=1.6']},
+      entry_points={'mkdocs.plugins': ['mkdocscs = mkdocscs.plugin:MkdocsCSPlugin'],
+                    'console_scripts': ['mkdocscs = mkdocscs.__main__:main']},
       zip_safe=False)
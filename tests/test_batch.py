@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+   Created on 18-10-2026
+"""
+__author__ = "Benedict Wilkins"
+__email__ = "benrjw@gmail.com"
+__status__ = "Development"
+
+import json
+import pathlib
+import threading
+import importlib.util
+
+import pytest
+
+from mkdocscs import Log
+from mkdocscs._batch import read_manifest, batch, build
+
+EXAMPLE_XML = pathlib.Path(__file__).parent.parent / "example" / "xml"
+
+Log(silent=True)
+
+def _pages(path):
+    return {p.relative_to(path).as_posix() : p.read_text() for p in pathlib.Path(path).rglob("*") 
+            if p.is_file() and p.name != ".mkdocscs.json"}
+
+def _manifest(path, projects):
+    manifest = pathlib.Path(path, "batch.json")
+    manifest.write_text(json.dumps(dict(projects=projects)))
+    return manifest
+
+def test_duplicate_names(tmp_path):
+    manifest = _manifest(tmp_path, [dict(xml=str(EXAMPLE_XML), output="a/docs"), dict(xml=str(EXAMPLE_XML), output="b/docs")])
+    with pytest.raises(ValueError, match="docs"):
+        read_manifest(manifest)
+    manifest = _manifest(tmp_path, [dict(xml=str(EXAMPLE_XML), output="a/docs", name="a"), dict(xml=str(EXAMPLE_XML), output="b/docs")])
+    assert [project['name'] for project in read_manifest(manifest)] == ["a", "docs"]
+
+def test_batch_matches_standalone(tmp_path):
+    build(xml=str(EXAMPLE_XML), output=str(tmp_path / "standalone"))
+    manifest = _manifest(tmp_path, [dict(xml=str(EXAMPLE_XML), output="a/docs", name="a"), 
+                                    dict(xml=str(EXAMPLE_XML), output="b/docs", name="b", namespaces=["Foos"])])
+    results = batch(read_manifest(manifest), workers=2)
+    assert [(result.name, result.error) for result in results] == [("a", None), ("b", None)]
+    assert _pages(tmp_path / "a" / "docs") == _pages(tmp_path / "standalone")
+    assert "Namespace/namespaceAloos.md" not in _pages(tmp_path / "b" / "docs")
+
+def test_threads_are_isolated(tmp_path):
+    build(xml=str(EXAMPLE_XML), output=str(tmp_path / "serial"))
+    errors = []
+    def _build(output, backend):
+        try:
+            build(xml=str(EXAMPLE_XML), output=str(output), workers=2, backend=backend)
+        except Exception as e:
+            errors.append(e)
+    backends = ["etree", "lxml"] if importlib.util.find_spec("lxml") is not None else ["etree"]
+    threads = [threading.Thread(target=_build, args=(tmp_path / f"thread{i}", backends[i % len(backends)])) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    for i in range(4):
+        assert _pages(tmp_path / f"thread{i}") == _pages(tmp_path / "serial")
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+   Created on 18-10-2026
+"""
+__author__ = "Benedict Wilkins"
+__email__ = "benrjw@gmail.com"
+__status__ = "Development"
+
+import os
+import sys
+import pathlib
+
+import pytest
+
+from mkdocscs import Log
+from mkdocscs._doxygen import parse_config, run_doxygen
+
+Log(silent=True)
+
+# writes index.xml to the xml output directory of the config (./xml) and counts its runs
+STUB = f"""#!{sys.executable}
+import pathlib
+pathlib.Path("xml").mkdir(exist_ok=True)
+pathlib.Path("xml", "index.xml").write_text("<doxygenindex/>")
+runs = pathlib.Path("runs")
+runs.write_text(str(int(runs.read_text()) + 1 if runs.exists() else 1))
+"""
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    bin = pathlib.Path(tmp_path, "bin")
+    bin.mkdir()
+    stub = pathlib.Path(bin, "doxygen")
+    stub.write_text(STUB)
+    stub.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin}{os.pathsep}{os.environ.get('PATH', '')}")
+    monkeypatch.chdir(tmp_path)
+    pathlib.Path(tmp_path, "src").mkdir()
+    pathlib.Path(tmp_path, "src", "a.cs").write_text("class A {}")
+    pathlib.Path(tmp_path, "Doxyfile").write_text("PROJECT_BRIEF = Bob's docs\nINPUT = src\nGENERATE_XML = YES\n")
+    return tmp_path
+
+def _runs(project):
+    return int(pathlib.Path(project, "runs").read_text())
+
+def test_quoting(tmp_path):
+    config = pathlib.Path(tmp_path, "Doxyfile")
+    config.write_text('PROJECT_BRIEF = Bob\'s docs\n'
+                      'INPUT = "a dir" b,c \\\n    d\n'
+                      'INPUT += e\n'
+                      'EXCLUDE = "it\'s here"\n'
+                      'ALIASES = x=\'y\'\n')
+    config = parse_config(config)
+    assert config["PROJECT_BRIEF"] == ["Bob's", "docs"]
+    assert config["INPUT"] == ["a dir", "b", "c", "d", "e"]
+    assert config["EXCLUDE"] == ["it's here"]
+    assert config["ALIASES"] == ["x='y'"]
+
+def test_skip_when_current(project):
+    xml = run_doxygen("Doxyfile")
+    assert xml == pathlib.Path(project, "xml").resolve()
+    assert pathlib.Path(project, "doxygen.log").exists()
+    run_doxygen("Doxyfile")
+    assert _runs(project) == 1
+    run_doxygen("Doxyfile", force=True)
+    assert _runs(project) == 2
+
+def test_rerun_on_change(project):
+    run_doxygen("Doxyfile")
+    pathlib.Path(project, "src", "a.cs").write_text("class A { int x; }")
+    run_doxygen("Doxyfile")
+    assert _runs(project) == 2
+    pathlib.Path(project, "src", "b.cs").write_text("class B {}")
+    run_doxygen("Doxyfile")
+    assert _runs(project) == 3
+    with pathlib.Path(project, "Doxyfile").open('a') as f:
+        f.write("EXTRACT_ALL = YES\n")
+    run_doxygen("Doxyfile")
+    assert _runs(project) == 4
+    run_doxygen("Doxyfile")
+    assert _runs(project) == 4
+
+def test_rerun_when_output_removed(project):
+    run_doxygen("Doxyfile")
+    pathlib.Path(project, "xml", "index.xml").unlink()
+    run_doxygen("Doxyfile")
+    assert _runs(project) == 2
+
+def test_failed_run(project):
+    pathlib.Path(project, "bin", "doxygen").write_text("#!/bin/sh\nexit 1\n")
+    with pytest.raises(ValueError):
+        run_doxygen("Doxyfile")
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+   Created on 18-10-2026
+"""
+__author__ = "Benedict Wilkins"
+__email__ = "benrjw@gmail.com"
+__status__ = "Development"
+
+import pathlib
+
+import pytest
+
+from mkdocscs import Log, SymbolTable, objectify
+from mkdocscs import _objectify
+from mkdocscs._batch import build
+
+EXAMPLE_XML = pathlib.Path(__file__).parent.parent / "example" / "xml"
+
+Log(silent=True)
+
+def _title(path):
+    return pathlib.Path(path).read_text().splitlines()[0]
+
+@pytest.mark.parametrize("options", [dict(), dict(lazy=True), dict(selective=True)])
+def test_nested_namespace_without_parent(tmp_path, options):
+    build(xml=str(EXAMPLE_XML), output=str(tmp_path), namespaces=["Foos::*"], **options)
+    assert not pathlib.Path(tmp_path, "Namespace", "namespaceFoos.md").exists()
+    # the parent is not selected, its name is kept but not linked
+    assert _title(tmp_path / "Namespace" / "namespaceFoos_1_1Goos.md") == \
+        "# Namespace Foos::[Goos](../Namespace/namespaceFoos_1_1Goos/)"
+    assert _title(tmp_path / "Class" / "classFoos_1_1Goos_1_1Gloo.md") == \
+        "# Class Foos::[Goos](../Namespace/namespaceFoos_1_1Goos/)::[Gloo](../Class/classFoos_1_1Goos_1_1Gloo/)"
+
+def test_nested_namespace_with_parent(tmp_path):
+    build(xml=str(EXAMPLE_XML), output=str(tmp_path), namespaces=["Foos"])
+    assert _title(tmp_path / "Namespace" / "namespaceFoos_1_1Goos.md") == \
+        "# Namespace [Foos](../Namespace/namespaceFoos/)::[Goos](../Namespace/namespaceFoos_1_1Goos/)"
+
+def test_file_compounds_are_not_read(monkeypatch):
+    read, files = _objectify.read, []
+    def _read(file, skip=None):
+        files.append(pathlib.Path(file).name)
+        return read(file, skip=skip)
+    monkeypatch.setattr(_objectify, "read", _read)
+    with SymbolTable():
+        objectify(str(EXAMPLE_XML), namespaces=["Foos"])
+    kinds = {entry.kind for id, entry in _objectify.scan_index(EXAMPLE_XML / "index.xml").items() if f"{id}.xml" in files}
+    assert "namespace" in kinds and "class" in kinds
+    assert not kinds & _objectify.SKIP_KINDS
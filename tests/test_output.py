@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+   Created on 18-10-2026
+"""
+__author__ = "Benedict Wilkins"
+__email__ = "benrjw@gmail.com"
+__status__ = "Development"
+
+import json
+import pathlib
+
+from mkdocscs import Log
+from mkdocscs.__main__ import main
+from mkdocscs.markdownify import OutputManifest
+
+EXAMPLE_XML = pathlib.Path(__file__).parent.parent / "example" / "xml"
+
+Log(silent=True)
+
+def _build(path, files, sync=False):
+    output = OutputManifest(path)
+    for name in files:
+        output.write(pathlib.Path(path, name), name)
+    if sync:
+        output.remove_stale()
+    output.save()
+    return output
+
+def test_unchanged_files_are_not_written(tmp_path):
+    _build(tmp_path, ["a.md", "b.md"])
+    assert _build(tmp_path, ["a.md", "b.md"]).changed == 0
+
+def test_stale_files_are_removed_by_a_later_sync(tmp_path):
+    _build(tmp_path, ["a.md", "sub/b.md"])
+    _build(tmp_path, ["a.md"]) # sub/b.md is no longer produced, but is not removed without sync
+    assert pathlib.Path(tmp_path, "sub/b.md").exists()
+    assert "sub/b.md" in json.loads(pathlib.Path(tmp_path, ".mkdocscs.json").read_text())['files']
+    _build(tmp_path, ["a.md"], sync=True)
+    assert not pathlib.Path(tmp_path, "sub/b.md").exists()
+    assert not pathlib.Path(tmp_path, "sub").exists()
+    assert set(json.loads(pathlib.Path(tmp_path, ".mkdocscs.json").read_text())['files']) == {"a.md"}
+
+def test_hand_written_files_are_never_removed(tmp_path):
+    pathlib.Path(tmp_path, "sub").mkdir()
+    pathlib.Path(tmp_path, "index.md").write_text("hand written")
+    pathlib.Path(tmp_path, "sub/notes.md").write_text("hand written")
+    _build(tmp_path, ["a.md", "sub/b.md"])
+    _build(tmp_path, [], sync=True)
+    assert pathlib.Path(tmp_path, "index.md").read_text() == "hand written"
+    assert pathlib.Path(tmp_path, "sub/notes.md").read_text() == "hand written"
+    assert not pathlib.Path(tmp_path, "a.md").exists() and not pathlib.Path(tmp_path, "sub/b.md").exists()
+
+def test_sync_after_a_build_without_sync(tmp_path):
+    docs = pathlib.Path(tmp_path, "docs")
+    page = pathlib.Path(docs, "Class", "classAloos_1_1Aloo.md")
+    notes = pathlib.Path(docs, "Class", "notes.md")
+    args = ["--silent", "--xml", str(EXAMPLE_XML), "--output", str(docs), "--project", str(docs)]
+    main(args)
+    notes.write_text("hand written")
+    assert page.exists()
+    main([*args, "--namespace", "Foos"]) # Aloos is no longer generated, its pages are left alone without --sync
+    assert page.exists()
+    main([*args, "--namespace", "Foos", "--sync"])
+    assert not page.exists()
+    assert notes.read_text() == "hand written"
+    files = json.loads(pathlib.Path(docs, ".mkdocscs.json").read_text())['files']
+    assert "Class/classAloos_1_1Aloo.md" not in files and "Class/classFoos_1_1Foo1.md" in files
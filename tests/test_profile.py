@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+   Created on 18-10-2026
+"""
+__author__ = "Benedict Wilkins"
+__email__ = "benrjw@gmail.com"
+__status__ = "Development"
+
+import json
+import pathlib
+
+import pytest
+
+from mkdocscs import Log, Profiler
+from mkdocscs._batch import build
+
+EXAMPLE_XML = pathlib.Path(__file__).parent.parent / "example" / "xml"
+
+Log(silent=True)
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_trace(tmp_path, workers):
+    profiler = Profiler.start()
+    try:
+        build(xml=str(EXAMPLE_XML), output=str(tmp_path / "docs"), workers=workers)
+    finally:
+        Profiler.stop()
+    profiler.write_trace(tmp_path / "trace.json")
+    events = json.loads(pathlib.Path(tmp_path, "trace.json").read_text())['traceEvents']
+    phases = {x['name'] : x for x in events if x['ph'] == "X" and x['cat'] == "phase"}
+    threads = {}
+    for x in events:
+        if x['ph'] == "X" and x['cat'] != "phase":
+            threads.setdefault(x['tid'], []).append(x)
+            phase = phases[x['cat']] # items are recorded in the phase of their category (parse, render)
+            assert phase['ts'] <= x['ts'] and x['ts'] + x['dur'] <= phase['ts'] + phase['dur']
+    assert len(threads) >= 2
+    for items in threads.values(): # items of a thread (worker) are sequential
+        items.sort(key=lambda x: x['ts'])
+        for a, b in zip(items, items[1:]):
+            assert a['ts'] + a['dur'] <= b['ts']
+    if workers is not None:
+        names = [x['args']['name'] for x in events if x['ph'] == "M"]
+        assert any(name.startswith("parse (worker") for name in names)
+        assert any(name.startswith("render (worker") for name in names)
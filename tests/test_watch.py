@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+   Created on 18-10-2026
+"""
+__author__ = "Benedict Wilkins"
+__email__ = "benrjw@gmail.com"
+__status__ = "Development"
+
+import shutil
+import pathlib
+
+import pytest
+
+from mkdocscs import Log, SymbolTable, objectify
+from mkdocscs._watch import WatchedModel, affected
+from mkdocscs.markdownify import markdownify
+
+EXAMPLE_XML = pathlib.Path(__file__).parent.parent / "example" / "xml"
+
+Log(silent=True)
+
+def _pages(path):
+    return {file.relative_to(path).as_posix() : file.read_text() for file in pathlib.Path(path).rglob("*")
+            if file.is_file() and file.name != ".mkdocscs.json"}
+
+def _edit(file, old, new):
+    text = file.read_text()
+    assert old in text
+    file.write_text(text.replace(old, new))
+
+@pytest.mark.parametrize("kwargs", [{}, dict(selective=True), dict(namespaces=["Foos"]), dict(lazy=True)])
+def test_edit_matches_a_new_build(tmp_path, kwargs):
+    xml = pathlib.Path(tmp_path, "xml")
+    shutil.copytree(EXAMPLE_XML, xml)
+    incremental, full = pathlib.Path(tmp_path, "incremental"), pathlib.Path(tmp_path, "full")
+    model, dependencies = WatchedModel(xml, **kwargs), {}
+    try:
+        assert model.refresh() is None
+        with model.symbols:
+            markdownify(model.objects, path=str(incremental), root_path=str(incremental), dependencies=dependencies)
+        _edit(pathlib.Path(xml, "classBar.xml"), "Some Documentation", "Other Documentation")
+        _edit(pathlib.Path(xml, "classFoos_1_1Foo1.xml"), "<briefdescription>", "<briefdescription><para>Edited</para>")
+        _edit(pathlib.Path(xml, "namespaceFoos.xml"), "<briefdescription>", "<briefdescription><para>Edited</para>")
+        changed = model.refresh()
+        assert changed is not None and changed <= {"classBar", "classFoos_1_1Foo1", "namespaceFoos"}
+        assert model.refresh() == set() # nothing changed since
+        with model.symbols:
+            markdownify(model.objects, path=str(incremental), root_path=str(incremental), pages=affected(changed, dependencies),
+                        dependencies=dependencies)
+    finally:
+        model.close()
+    with SymbolTable():
+        markdownify(objectify(str(xml), **kwargs), path=str(full), root_path=str(full))
+    assert _pages(incremental) == _pages(full)
+
+def test_index_change_builds_again(tmp_path):
+    xml = pathlib.Path(tmp_path, "xml")
+    shutil.copytree(EXAMPLE_XML, xml)
+    model = WatchedModel(xml)
+    try:
+        model.refresh()
+        _edit(pathlib.Path(xml, "index.xml"), "<name>Bar</name>", "<name>Baz</name>")
+        assert model.refresh() is None
+    finally:
+        model.close()